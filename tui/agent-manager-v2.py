@@ -14,10 +14,13 @@ Key features:
 import sys
 import os
 import signal
+import shutil
 import subprocess
+import tempfile
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Set, Tuple
 
 # Add all modules to path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -27,6 +30,80 @@ from core.tui_engine import TUIEngine, TUIError
 from ui.components import create_agent_manager_ui, PaneType
 from data.file_parser import FileParser, ProjectState
 import curses
+from types import MappingProxyType
+
+# Dispatch tables built once at import; input handling is a dict lookup
+_GLOBAL_KEY_ACTIONS = MappingProxyType({
+    ord('q'): "quit",
+    ord('r'): "refresh",
+    9: "switch_pane",  # Tab
+    ord('?'): "help",
+    ord('h'): "help",
+})
+
+_REVIEW_ITEM_ACTIONS = MappingProxyType({
+    "approve_item": "approve",
+    "block_item": "block",
+    "revision_item": "revision",
+    "defer_item": "defer",
+})
+
+_REASON_MAP = MappingProxyType({
+    "approve": "Approved via TUI",
+    "block": "Blocked via TUI - needs review",
+    "revision": "Revision requested via TUI",
+    "defer": "Deferred via TUI",
+})
+
+_NAV_KEYS = frozenset({curses.KEY_UP, curses.KEY_DOWN, ord('j'), ord('k')})
+
+# Static details pane tails, shared by every formatted view
+_AGENT_ACTION_HINTS = (
+    "",
+    "Actions:",
+    "  [Enter] View handoff file",
+    "  [h] Create new handoff",
+    "  [t] Update task status",
+)
+
+_REVIEW_ACTION_HINTS = (
+    "",
+    "Actions:",
+    "  [a] Approve",
+    "  [b] Block",
+    "  [r] Request revision",
+    "  [d] Defer",
+)
+
+_GENERAL_CONTROLS = (
+    "",
+    "General Controls:",
+    "  [Tab] Switch panes",
+    "  [r] Refresh data",
+    "  [q] Quit",
+    "  [?] Help",
+)
+
+_NO_AGENT_SELECTED = "No agent selected"
+_NO_REVIEW_ITEM_SELECTED = "No review item selected"
+_HELP_MESSAGE = "Help: q=quit, r=refresh, Tab=switch, ↑↓=navigate, a/b/r/d=review actions"
+
+def _open_pidfd(pid: int) -> Optional[int]:
+    """An fd that turns readable when the process exits, where the OS has them"""
+    pidfd_open = getattr(os, "pidfd_open", None)  # Linux 5.3+, Python 3.9+
+    if pidfd_open is None:
+        return None
+    try:
+        return pidfd_open(pid)
+    except OSError:
+        return None
+
+def _close_action_files(stderr_file, pidfd: Optional[int]):
+    """Release what a reaped review script held open"""
+    if stderr_file is not None:
+        stderr_file.close()
+    if pidfd is not None:
+        os.close(pidfd)
 
 class AgentManagerApp:
     """
@@ -40,6 +117,13 @@ class AgentManagerApp:
     - Production-ready error handling
     """
     
+    # Human review script locations, relative to the project root
+    REVIEW_SCRIPT_CANDIDATES = (
+        "docs/human-review/quick-approve.sh",
+        "../human-review/quick-approve.sh",
+    )
+    REVIEW_SCRIPT_NAME = "quick-approve.sh"
+    
     def __init__(self, debug: bool = False):
         self.debug = debug
         self.tui_engine = TUIEngine(debug=debug)
@@ -47,20 +131,54 @@ class AgentManagerApp:
         self.layout_manager = None
         self.components = None
         self.last_data_refresh = datetime.now()
-        self.refresh_interval = timedelta(seconds=10)  # Refresh every 10 seconds
+        self.refresh_interval = timedelta(seconds=1)  # Stat check cadence, parsing only on change
+        self._mtime_cache: Dict[str, Tuple[int, int]] = {}
+        self._last_agents_version = -1  # ProjectState versions shown by the panes
+        self._last_review_version = -1
+        
+        # Formatted details keyed by (focused pane, selection id, data version)
+        self._data_version = 0
+        self._details_cache: "OrderedDict[tuple, list]" = OrderedDict()
+        self.details_cache_size = 64
+        self._details_dirty = False  # Navigation bursts rebuild details once per frame
+        # Minutes since the last update of the agent each pane shows, as painted
+        self._tasks_update_age: Optional[int] = None
+        self._details_update_age: Optional[int] = None
         self.current_state: Optional[ProjectState] = None
         
+        # Review scripts still running: (process, agent_id, action, start time,
+        # stderr file, pidfd). stderr goes to a temp file, not a pipe nobody reads
+        # until exit, so a chatty script can never block on a full pipe
+        self._pending_actions: List[Tuple[subprocess.Popen, str, str, float, Any, Optional[int]]] = []
+        self.action_timeout = 10  # Seconds before a review script is killed
+        self.action_poll_interval = 0.1  # Reap cadence where pidfds are unavailable
+        
         # Status tracking
         self.status_message = "Agent Manager Ready"
         self.error_count = 0
         self.last_action = "startup"
         
+        # Resolved once; actions must not probe the filesystem per keystroke
+        self._review_script = self._resolve_review_script()
+        
         # Create UI components
         self._initialize_ui()
         
+        # Damage tracking: panes to repaint on the next frame
+        self._dirty: Set[PaneType] = set(self.components)
+        self._full_redraw = True
+        self._last_status_text: Optional[str] = None  # Status line as last painted
+        
         # Set up TUI engine handlers
         self._setup_handlers()
         
+        # Bound handlers for _GLOBAL_KEY_ACTIONS
+        self._global_handlers = {
+            "refresh": self._on_refresh,
+            "switch_pane": self._on_switch_pane,
+            "help": self._on_help,
+        }
+        
     def _initialize_ui(self):
         """Initialize UI components"""
         try:
@@ -69,12 +187,43 @@ class AgentManagerApp:
         except Exception as e:
             raise TUIError(f"Failed to initialize UI: {e}")
             
+    def _resolve_review_script(self) -> Optional[str]:
+        """Find the human review script, returning its absolute path"""
+        # One access() per candidate: also rejects scripts missing the execute bit
+        candidate = next((path for path in self.REVIEW_SCRIPT_CANDIDATES
+                          if os.access(path, os.X_OK)), None)
+        if candidate:
+            return os.path.abspath(candidate)
+            
+        # Fall back to a PATH install, e.g. ~/.local/bin
+        candidate = shutil.which(self.REVIEW_SCRIPT_NAME)
+        if candidate:
+            return candidate
+            
+        self.tui_engine.logger.warning("Human review script not found; review actions disabled")
+        return None
+        
     def _setup_handlers(self):
         """Setup TUI engine event handlers"""
         self.tui_engine.set_draw_handler(self._draw_interface)
         self.tui_engine.set_input_handler(self._handle_input)
         self.tui_engine.set_resize_handler(self._handle_resize)
         self.tui_engine.set_error_handler(self._handle_error)
+        self.tui_engine.set_wait_handler(self._next_wakeup)
+        
+    def _next_wakeup(self) -> Tuple[float, List[int]]:
+        """Seconds until the next stat check or action timeout, plus child fds to watch"""
+        timeout = (self.last_data_refresh + self.refresh_interval - datetime.now()).total_seconds()
+        now = time.monotonic()
+        fds = []
+        for _, _, _, started, _, pidfd in self._pending_actions:
+            timeout = min(timeout, started + self.action_timeout - now)
+            # A pidfd turns readable only when the script exits
+            if pidfd is not None:
+                fds.append(pidfd)
+            else:
+                timeout = min(timeout, self.action_poll_interval)
+        return max(0.0, timeout), fds
         
     def _refresh_data(self, force: bool = False):
         """Refresh data from files"""
@@ -83,29 +232,52 @@ class AgentManagerApp:
             if not force and datetime.now() - self.last_data_refresh < self.refresh_interval:
                 return
                 
-            # Parse current project state
-            self.current_state = self.file_parser.parse_project_state(force_refresh=force)
+            # Skip parsing entirely while no source file changed
+            file_stamps = self.file_parser.get_file_stamps()
+            if not force and file_stamps == self._mtime_cache:
+                self.last_data_refresh = datetime.now()
+                return
+                
+            # Parse current project state (stamps already proved it stale)
+            previous_state = self.current_state
+            self.current_state = self.file_parser.parse_project_state(force_refresh=True)
             
-            # Update UI components with new data
-            if self.current_state:
+            # Update UI components with new data (cached state means nothing changed)
+            if self.current_state and self.current_state is not previous_state:
+                # New data invalidates every formatted details view
+                self._data_version += 1
+                self._details_cache.clear()
+                
                 # Update agents list
-                agents_list = list(self.current_state.agents.values())
-                self.components[PaneType.AGENTS].set_agents(agents_list)
+                agent_component = self.components[PaneType.AGENTS]
+                if self.current_state.agents_version != self._last_agents_version:
+                    agent_component.set_agents(list(self.current_state.agents.values()))
+                    self._last_agents_version = self.current_state.agents_version
+                    self._mark_dirty(PaneType.AGENTS)
                 
                 # Update review queue
-                self.components[PaneType.REVIEW].set_review_items(self.current_state.review_items)
+                if self.current_state.review_version != self._last_review_version:
+                    self.components[PaneType.REVIEW].set_review_items(self.current_state.review_items)
+                    self._last_review_version = self.current_state.review_version
+                    self._mark_dirty(PaneType.REVIEW)
                 
                 # Update task details for selected agent
-                selected_agent = self.components[PaneType.AGENTS].get_selected_agent()
-                self.components[PaneType.TASKS].set_selected_agent(selected_agent)
+                selected_agent = agent_component.get_selected_agent()
+                if selected_agent != self.components[PaneType.TASKS].selected_agent:
+                    self.components[PaneType.TASKS].set_selected_agent(selected_agent)
+                    self._mark_dirty(PaneType.TASKS)
                 
                 # Update details pane based on current focus
                 self._update_details_pane()
                 
+            # Only a successful update settles these stamps; a failed parse
+            # is retried on the next tick even if no file changes
+            self._mtime_cache = file_stamps
             self.last_data_refresh = datetime.now()
-            self.status_message = f"Data refreshed at {self.last_data_refresh.strftime('%H:%M:%S')}"
+            self.status_message = f"Data refreshed at {self.current_state.last_refresh_display}"
             
         except Exception as e:
+            self.last_data_refresh = datetime.now()  # Retry next tick, not every frame
             self.error_count += 1
             self.status_message = f"Error refreshing data: {e}"
             self.tui_engine.logger.error(f"Data refresh error: {e}")
@@ -113,35 +285,95 @@ class AgentManagerApp:
     def _update_details_pane(self):
         """Update details pane content based on current focus"""
         try:
-            details_lines = []
+            focused_pane = self.layout_manager.focused_pane
             
-            if self.layout_manager.focused_pane == PaneType.AGENTS:
+            if focused_pane == PaneType.AGENTS:
+                selection = self.components[PaneType.AGENTS].get_selected_agent()
+            elif focused_pane == PaneType.REVIEW:
+                selection = self.components[PaneType.REVIEW].get_selected_item()
+            else:
+                selection = None
+                
+            # Formatted lines only change with the selection, the data or, for
+            # agents, the relative "Last Update" time, which ages by itself
+            last_update = None
+            if focused_pane == PaneType.AGENTS and selection:
+                last_update = self._format_last_update(selection)
+            cache_key = (focused_pane, id(selection), self._data_version, last_update)
+            details_lines = self._details_cache.get(cache_key)
+            
+            if details_lines is not None:
+                self._details_cache.move_to_end(cache_key)
+                
+            elif focused_pane == PaneType.AGENTS:
                 # Show selected agent details
-                selected_agent = self.components[PaneType.AGENTS].get_selected_agent()
-                if selected_agent:
-                    details_lines = self._format_agent_details(selected_agent)
+                if selection:
+                    details_lines = self._format_agent_details(selection, last_update)
                 else:
-                    details_lines = ["No agent selected"]
+                    details_lines = [_NO_AGENT_SELECTED]
                     
-            elif self.layout_manager.focused_pane == PaneType.REVIEW:
+            elif focused_pane == PaneType.REVIEW:
                 # Show selected review item details
-                selected_item = self.components[PaneType.REVIEW].get_selected_item()
-                if selected_item:
-                    details_lines = self._format_review_details(selected_item)
+                if selection:
+                    details_lines = self._format_review_details(selection)
                 else:
-                    details_lines = ["No review item selected"]
+                    details_lines = [_NO_REVIEW_ITEM_SELECTED]
                     
             else:
                 # Show general information
                 details_lines = self._format_general_details()
                 
+            if cache_key not in self._details_cache:
+                self._details_cache[cache_key] = details_lines
+                if len(self._details_cache) > self.details_cache_size:
+                    self._details_cache.popitem(last=False)
+                
             self.components[PaneType.DETAILS].set_content(details_lines)
+            self._mark_dirty(PaneType.DETAILS)
             
         except Exception as e:
             self.tui_engine.logger.error(f"Error updating details pane: {e}")
             
-    def _format_agent_details(self, agent) -> list:
+    def _age_relative_times(self):
+        """Repaint "Last Update ... ago" lines once their minute rolls over"""
+        # The task pane shows its own agent, which only follows the list
+        # selection on Enter or a refresh, and times it from last_update
+        agent = self.components[PaneType.TASKS].selected_agent
+        age = None
+        if agent is not None and agent.last_update is not None:
+            age = int((datetime.now() - agent.last_update).total_seconds()) // 60
+        if age != self._tasks_update_age:
+            self._tasks_update_age = age
+            self._mark_dirty(PaneType.TASKS)
+            
+        # The details pane follows the highlighted agent while the list is focused
+        if self.layout_manager.focused_pane != PaneType.AGENTS:
+            return
+        agent = self.components[PaneType.AGENTS].get_selected_agent()
+        age = None
+        if agent is not None and agent.last_update_epoch is not None:
+            age = int(time.time() - agent.last_update_epoch) // 60
+        if age != self._details_update_age:
+            self._details_update_age = age
+            self._details_dirty = True
+            
+    def _mark_dirty(self, *panes: PaneType):
+        """Schedule panes for repaint on the next frame"""
+        self._dirty.update(panes)
+        
+    def _format_last_update(self, agent) -> str:
+        """Relative "Last Update" line for an agent"""
+        if agent.last_update_epoch is None:
+            return "Last Update: Unknown"
+        # Whole-second math; total hours so multi-day gaps are not wrapped
+        hours, remainder = divmod(max(0, int(time.time() - agent.last_update_epoch)), 3600)
+        return f"Last Update: {hours}h {remainder // 60}m ago"
+        
+    def _format_agent_details(self, agent, last_update: Optional[str] = None) -> list:
         """Format agent details for display"""
+        if last_update is None:
+            last_update = self._format_last_update(agent)
+            
         lines = [
             f"Agent: {agent.agent_id}",
             f"Status: {agent.status}",
@@ -150,42 +382,26 @@ class AgentManagerApp:
             "",
             "Current Task:",
             f"  {agent.current_task}",
+            "",
+            last_update,
             ""
         ]
         
-        if agent.last_update:
-            time_ago = datetime.now() - agent.last_update
-            hours = time_ago.seconds // 3600
-            minutes = (time_ago.seconds // 60) % 60
-            lines.append(f"Last Update: {hours}h {minutes}m ago")
-        else:
-            lines.append("Last Update: Unknown")
-            
-        lines.append("")
-        
         if agent.files_owned:
             lines.append("Files Owned:")
-            for file_path in agent.files_owned:
-                lines.append(f"  {file_path}")
+            lines += [f"  {file_path}" for file_path in agent.files_owned]
             lines.append("")
             
         if agent.blockers:
             lines.append("Blockers:")
-            for blocker in agent.blockers:
-                lines.append(f"  • {blocker}")
+            lines += [f"  • {blocker}" for blocker in agent.blockers]
             lines.append("")
             
         if agent.handoff_file:
             lines.append(f"Handoff File: {agent.handoff_file}")
             
         # Add action hints
-        lines.extend([
-            "",
-            "Actions:",
-            "  [Enter] View handoff file",
-            "  [h] Create new handoff",
-            "  [t] Update task status"
-        ])
+        lines += _AGENT_ACTION_HINTS
         
         return lines
         
@@ -203,32 +419,21 @@ class AgentManagerApp:
         ]
         
         if item.timestamp:
-            lines.append(f"Added: {item.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+            lines.append(f"Added: {item.timestamp_display}")
             
         if item.deadline:
-            lines.append(f"Deadline: {item.deadline.strftime('%Y-%m-%d %H:%M:%S')}")
+            lines.append(f"Deadline: {item.deadline_display}")
             
         if item.files:
-            lines.append("")
-            lines.append("Related Files:")
-            for file_path in item.files:
-                lines.append(f"  {file_path}")
+            lines += ("", "Related Files:")
+            lines += [f"  {file_path}" for file_path in item.files]
                 
         if item.blockers:
-            lines.append("")
-            lines.append("Blocking:")
-            for blocker in item.blockers:
-                lines.append(f"  {blocker}")
+            lines += ("", "Blocking:")
+            lines += [f"  {blocker}" for blocker in item.blockers]
                 
         # Add action hints
-        lines.extend([
-            "",
-            "Actions:",
-            "  [a] Approve",
-            "  [b] Block",
-            "  [r] Request revision",
-            "  [d] Defer"
-        ])
+        lines += _REVIEW_ACTION_HINTS
         
         return lines
         
@@ -243,93 +448,102 @@ class AgentManagerApp:
             lines.extend([
                 f"Total Agents: {len(self.current_state.agents)}",
                 f"Review Items: {len(self.current_state.review_items)}",
-                f"Last Refresh: {self.current_state.last_refresh.strftime('%H:%M:%S')}",
+                f"Last Refresh: {self.current_state.last_refresh_display}",
                 ""
             ])
             
-            # Agent status summary
-            status_counts = {}
-            for agent in self.current_state.agents.values():
-                status_counts[agent.status] = status_counts.get(agent.status, 0) + 1
-                
+            # Agent status summary (pre-aggregated by the parser)
             lines.append("Agent Status Summary:")
-            for status, count in status_counts.items():
+            for status, count in self.current_state.status_counts.most_common():
                 lines.append(f"  {status}: {count}")
                 
             lines.append("")
             
             # Review priority summary
-            priority_counts = {}
-            for item in self.current_state.review_items:
-                priority_counts[item.priority] = priority_counts.get(item.priority, 0) + 1
-                
             lines.append("Review Queue Summary:")
-            for priority, count in priority_counts.items():
+            for priority, count in self.current_state.priority_counts.most_common():
                 lines.append(f"  {priority}: {count}")
                 
         # Add general controls
-        lines.extend([
-            "",
-            "General Controls:",
-            "  [Tab] Switch panes",
-            "  [r] Refresh data",
-            "  [q] Quit",
-            "  [?] Help"
-        ])
+        lines += _GENERAL_CONTROLS
         
         return lines
         
     def _execute_human_review_action(self, action: str, agent_id: str, reason: str = ""):
         """Execute human review action using scripts"""
         try:
-            script_path = "docs/human-review/quick-approve.sh"
-            
-            if not os.path.exists(script_path):
-                # Try relative path
-                script_path = "../human-review/quick-approve.sh"
-                
-            if not os.path.exists(script_path):
+            if self._review_script is None:
                 self.status_message = "Error: Human review script not found"
                 return False
                 
             # Execute the approval script
-            cmd = [script_path, agent_id, action]
+            cmd = [self._review_script, agent_id, action]
             if reason:
                 cmd.append(reason)
                 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+            # Run in the background; completion is collected by _poll_pending_actions
+            stderr_file = tempfile.TemporaryFile()
+            try:
+                proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=stderr_file)
+            except Exception:
+                stderr_file.close()
+                raise
+            self._pending_actions.append((proc, agent_id, action, time.monotonic(),
+                                          stderr_file, _open_pidfd(proc.pid)))
+            self.status_message = f"⏳ {action.title()} {agent_id}..."
+            return True
             
-            if result.returncode == 0:
-                self.status_message = f"✅ {action.title()} action completed for {agent_id}"
-                # Force data refresh to show changes
-                self._refresh_data(force=True)
-                return True
-            else:
-                self.status_message = f"❌ Error executing {action}: {result.stderr}"
-                return False
-                
-        except subprocess.TimeoutExpired:
-            self.status_message = "❌ Timeout executing human review action"
-            return False
         except Exception as e:
             self.status_message = f"❌ Error: {e}"
             return False
             
+    def _poll_pending_actions(self):
+        """Collect finished or timed-out review scripts without blocking"""
+        if not self._pending_actions:
+            return
+            
+        still_running = []
+        refresh_needed = False
+        
+        for pending in self._pending_actions:
+            proc, agent_id, action, started, stderr_file, pidfd = pending
+            if proc.poll() is None:
+                if time.monotonic() - started < self.action_timeout:
+                    still_running.append(pending)
+                    continue
+                    
+                proc.kill()
+                proc.wait()
+                _close_action_files(stderr_file, pidfd)
+                self.status_message = "❌ Timeout executing human review action"
+                continue
+                
+            _close_action_files(None, pidfd)
+            with stderr_file:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode(errors="replace")
+            if proc.returncode == 0:
+                self.status_message = f"✅ {action.title()} action completed for {agent_id}"
+                refresh_needed = True
+            else:
+                self.status_message = f"❌ Error executing {action}: {stderr}"
+                
+        self._pending_actions = still_running
+        
+        # Force data refresh to show changes, keeping the action outcome visible
+        if refresh_needed:
+            status_message = self.status_message
+            self._refresh_data(force=True)
+            self.status_message = status_message
+            
     def _handle_review_action(self, action: str):
         """Handle review queue actions"""
         selected_item = self.components[PaneType.REVIEW].get_selected_item()
         if not selected_item:
-            self.status_message = "No review item selected"
+            self.status_message = _NO_REVIEW_ITEM_SELECTED
             return
             
-        reason_map = {
-            "approve": "Approved via TUI",
-            "block": "Blocked via TUI - needs review",
-            "revision": "Revision requested via TUI",
-            "defer": "Deferred via TUI"
-        }
-        
-        reason = reason_map.get(action, f"Action: {action}")
+        reason = _REASON_MAP.get(action, f"Action: {action}")
         
         if self._execute_human_review_action(action, selected_item.agent_id, reason):
             self.last_action = f"{action} {selected_item.agent_id}"
@@ -337,25 +551,50 @@ class AgentManagerApp:
             self.last_action = f"failed {action}"
             
     def _draw_interface(self, stdscr, terminal_info):
-        """Main drawing function for TUI engine"""
+        """Main drawing function for TUI engine; returns False when nothing was drawn"""
         try:
-            # Refresh data if needed
+            # Reap background review actions, then refresh data if needed
+            self._poll_pending_actions()
             self._refresh_data()
+            self._age_relative_times()
             
-            # Update layout for current terminal size
-            self.layout_manager.update_layout(terminal_info.width, terminal_info.height)
+            # Coalesce queued navigation into a single details rebuild
+            if self._details_dirty:
+                self._details_dirty = False
+                self._update_details_pane()
             
-            # Draw all components
-            self.layout_manager.draw_all(stdscr, terminal_info)
+            # The engine cleared the screen (resize, error recovery): repaint everything
+            if self.tui_engine.screen_cleared:
+                self.tui_engine.screen_cleared = False
+                self._full_redraw = True
+                
+            if self._full_redraw:
+                # Update layout for current terminal size
+                self.layout_manager.update_layout(terminal_info.width, terminal_info.height)
+                
+            # Draw damaged components (None repaints everything)
+            dirty = None if self._full_redraw else self._dirty
+            painted = self._full_redraw or bool(self._dirty)
+            self.layout_manager.draw_all(stdscr, terminal_info, dirty)
+            self._full_redraw = False
+            self._dirty.clear()
             
-            # Draw status message
-            status_y = terminal_info.height - 1
+            # Draw status message, padded to clear stale text. The footer shares
+            # its row, so it is repainted whenever panes were drawn or it changed
             status_text = f"Status: {self.status_message} | Last: {self.last_action}"
-            self.tui_engine.safe_addstr(status_y, 0, status_text, max_width=terminal_info.width)
+            if painted or status_text != self._last_status_text:
+                status_y = terminal_info.height - 1
+                self.tui_engine.safe_addstr(status_y, 0, status_text.ljust(terminal_info.width - 1),
+                                            max_width=terminal_info.width)
+                self._last_status_text = status_text
+                painted = True
+                
+            return painted
             
         except Exception as e:
             self.tui_engine.logger.error(f"Draw error: {e}")
             # Try to display error on screen
+            self._full_redraw = True
             try:
                 stdscr.clear()
                 stdscr.addstr(0, 0, f"Display Error: {e}")
@@ -367,33 +606,27 @@ class AgentManagerApp:
         """Handle keyboard input"""
         try:
             # Global shortcuts
-            if key == ord('q'):
+            global_action = _GLOBAL_KEY_ACTIONS.get(key)
+            if global_action == "quit":
                 return "quit"
-            elif key == ord('r'):
-                self._refresh_data(force=True)
-                self.last_action = "refresh"
-            elif key == 9:  # Tab
-                self.layout_manager.cycle_focus()
-                self._update_details_pane()
-                self.last_action = "switch pane"
-            elif key == ord('?') or key == ord('h'):
-                self.status_message = "Help: q=quit, r=refresh, Tab=switch, ↑↓=navigate, a/b/r/d=review actions"
-                self.last_action = "help"
+            elif global_action is not None:
+                self._global_handlers[global_action]()
                 
             # Pane-specific shortcuts
             else:
                 action = self.layout_manager.handle_key(key)
+                self._mark_dirty(self.layout_manager.focused_pane)
                 
                 if action == "select_agent":
                     # Update task details when agent is selected
                     selected_agent = self.components[PaneType.AGENTS].get_selected_agent()
                     self.components[PaneType.TASKS].set_selected_agent(selected_agent)
+                    self._mark_dirty(PaneType.TASKS)
                     self._update_details_pane()
                     self.last_action = f"selected {selected_agent.agent_id if selected_agent else 'none'}"
                     
-                elif action in ["approve_item", "block_item", "revision_item", "defer_item"]:
-                    action_name = action.replace("_item", "")
-                    self._handle_review_action(action_name)
+                elif action in _REVIEW_ITEM_ACTIONS:
+                    self._handle_review_action(_REVIEW_ITEM_ACTIONS[action])
                     
                 elif action == "select_item":
                     # Update details for selected review item
@@ -401,9 +634,9 @@ class AgentManagerApp:
                     selected_item = self.components[PaneType.REVIEW].get_selected_item()
                     self.last_action = f"selected review {selected_item.agent_id if selected_item else 'none'}"
                     
-                # Update details pane when navigation changes
-                if key in [curses.KEY_UP, curses.KEY_DOWN, ord('j'), ord('k')]:
-                    self._update_details_pane()
+                # Update details pane on the next frame when navigation changes
+                if key in _NAV_KEYS:
+                    self._details_dirty = True
                     
         except Exception as e:
             self.tui_engine.logger.error(f"Input handling error: {e}")
@@ -411,10 +644,29 @@ class AgentManagerApp:
             
         return None
         
+    def _on_refresh(self):
+        """Global [r]: force a data refresh"""
+        self._refresh_data(force=True)
+        self.last_action = "refresh"
+        
+    def _on_switch_pane(self):
+        """Global [Tab]: move focus to the next pane"""
+        previous_pane = self.layout_manager.focused_pane
+        self.layout_manager.cycle_focus()
+        self._mark_dirty(previous_pane, self.layout_manager.focused_pane)
+        self._update_details_pane()
+        self.last_action = "switch pane"
+        
+    def _on_help(self):
+        """Global [h]/[?]: show key help in the status line"""
+        self.status_message = _HELP_MESSAGE
+        self.last_action = "help"
+        
     def _handle_resize(self, old_info, new_info):
         """Handle terminal resize"""
         try:
             self.layout_manager.update_layout(new_info.width, new_info.height)
+            self._full_redraw = True
             self.status_message = f"Resized to {new_info.width}x{new_info.height}"
             self.last_action = "resize"
         except Exception as e:
@@ -454,14 +706,14 @@ def main():
         return 1
         
     try:
-        print("Starting Agent Manager TUI...")
-        print("Terminal interface for multi-agent workflow management")
-        print("Press 'q' to quit, '?' for help")
-        print()
-        
-        # Check terminal compatibility
-        from core.tui_engine import test_terminal_compatibility
-        compat = test_terminal_compatibility()
+        sys.stdout.write("Starting Agent Manager TUI...\n"
+                         "Terminal interface for multi-agent workflow management\n"
+                         "Press 'q' to quit, '?' for help\n\n")
+        sys.stdout.flush()
+        
+        # Check terminal compatibility (probed once per terminal type)
+        from core.tui_engine import cached_terminal_compatibility
+        compat = cached_terminal_compatibility()
         
         if not compat['supported']:
             print(f"Terminal compatibility issue: {compat.get('error', 'Unknown error')}")
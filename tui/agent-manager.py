@@ -8,61 +8,161 @@ Dependencies: Standard Python 3.6+ (no external dependencies)
 """
 
 import curses
+import functools
 import os
+import select
+import signal
 import sys
 import json
 import time
-import glob
+import fnmatch
 import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import re
 
+# Parser patterns, compiled once at import
+_RE_HANDOFF_ID = re.compile(r'handoff-(\d+_\d+)')
+_RE_HANDOFF_FIELDS = re.compile(
+    r'\*\*Description\*\*: (?=(?P<desc>.+))'  # Lookahead: later fields may share the line
+    r'|\*\*Confidence\*\*: (?P<conf>\w+)'
+    r'|\*\*Priority\*\*: (?P<prio>\w+)'
+    r'|(?P<blockers>## 🚨 Blockers)'
+)
+_RE_OWN = re.compile(r'\*\*Agent (\d+)\*\*: `([^`]+)`')
+_RE_REVIEW = re.compile(r'- \*\*\[([^\]]+)\]\*\* - (.+)')
+
+# Statuses always present in the header summary
+_AGENT_STATUSES = ("active", "blocked", "completed", "idle")
+
+# Review queue display order
+_PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2}
+
+# Pane icons
+_PRIORITY_ICON = {"critical": "🚨", "high": "🟡", "medium": "🟢"}
+_STATUS_ICON = {"active": "🟢", "blocked": "🔴", "completed": "✅", "idle": "⚪"}
+_CONF_ICON = {"high": "🟢", "medium": "🟡", "low": "🔴"}
+
+def _section(content: str, marker: str, start: int = 0) -> Optional[str]:
+    """Text after the first marker up to the next '##', or None if the marker is absent"""
+    i = content.find(marker, start)
+    if i < 0:
+        return None
+    i += len(marker)
+    j = content.find('##', i)
+    return content[i:j] if j >= 0 else content[i:]
+
+def _read_small(path: str, size: int) -> str:
+    """Read a small text file in one os.read sized from an existing stat"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, size + 1)  # One extra byte detects growth since the stat
+        if len(data) > size:
+            chunks = [data]
+            while chunk := os.read(fd, 65536):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+    finally:
+        os.close(fd)
+    # Match text-mode open(): universal newlines
+    return data.decode('utf-8', 'replace').replace('\r\n', '\n').replace('\r', '\n')
+
+@functools.lru_cache(maxsize=128)
+def _format_agent_block(agent_id: str, status: str, current_task: str, confidence: str,
+                        minutes_ago: Optional[int], files_owned: Tuple[str, ...],
+                        blockers: Tuple[str, ...], width: int) -> Tuple[str, ...]:
+    """Tasks pane lines for one agent, pre-sliced to the pane width"""
+    task_lines = [
+        f"Agent: {agent_id}",
+        f"Status: {status}",
+        f"Task: {current_task[:width-10]}",
+        f"Confidence: {confidence}",
+        ""
+    ]
+    
+    if minutes_ago is not None:
+        task_lines.append(f"Last Update: {minutes_ago//60}h {minutes_ago%60}m ago")
+    else:
+        task_lines.append("Last Update: Unknown")
+        
+    if files_owned:
+        task_lines.append("Files Owned:")
+        for file_path in files_owned[:3]:
+            task_lines.append(f"  {file_path}")
+            
+    if blockers:
+        task_lines.append("Blockers:")
+        for blocker in blockers[:2]:
+            task_lines.append(f"  {blocker[:width-5]}")
+            
+    return tuple(line[:width-1] for line in task_lines)
+
 class AgentStatus:
     """Represents the current status of an agent"""
     def __init__(self, agent_id: str):
-        self.agent_id = agent_id
+        self.agent_id = sys.intern(agent_id)  # Interned: used as the agents dict key
         self.status = "unknown"  # active, blocked, completed, idle
         self.confidence = "medium"  # high, medium, low
         self.current_task = "No active task"
         self.last_update = None
+        self.last_update_ts: Optional[float] = None  # last_update as epoch seconds, for comparisons
         self.files_owned = []
         self.blockers = []
         self.handoff_ready = False
         
     @classmethod
-    def from_handoff_file(cls, handoff_file: str) -> 'AgentStatus':
-        """Create AgentStatus from handoff file content"""
+    def from_handoff_file(cls, handoff_file: str, mtime: Optional[float] = None,
+                          size: Optional[int] = None) -> 'AgentStatus':
+        """Create AgentStatus from handoff file content (mtime/size from a known stat skip re-stats)"""
         agent = cls("unknown")
         try:
-            with open(handoff_file, 'r') as f:
-                content = f.read()
+            if size is not None:
+                content = _read_small(handoff_file, size)
+            else:
+                with open(handoff_file, 'r') as f:
+                    content = f.read()
                 
             # Extract agent info from handoff
-            if match := re.search(r'handoff-(\d+_\d+)', handoff_file):
-                agent.agent_id = f"handoff-{match.group(1)}"
+            if match := _RE_HANDOFF_ID.search(handoff_file):
+                agent.agent_id = sys.intern(f"handoff-{match.group(1)}")
                 
-            # Extract task description
-            if match := re.search(r'\*\*Description\*\*: (.+)', content):
-                agent.current_task = match.group(1).strip()
+            # Extract description, confidence, priority and blockers in one
+            # scan; the first occurrence of each field wins
+            seen = set()
+            blocked = False
+            for match in _RE_HANDOFF_FIELDS.finditer(content):
+                field = match.lastgroup
+                if field in seen:
+                    continue
+                seen.add(field)
                 
-            # Extract confidence
-            if match := re.search(r'\*\*Confidence\*\*: (\w+)', content):
-                agent.confidence = match.group(1).lower()
-                
-            # Extract priority/status
-            if match := re.search(r'\*\*Priority\*\*: (\w+)', content):
-                priority = match.group(1).lower()
-                agent.status = "blocked" if priority == "critical" else "active"
-                
-            # Extract blockers
-            if "## 🚨 Blockers" in content:
+                if field == "desc":
+                    agent.current_task = match.group(field).strip()
+                elif field == "conf":
+                    agent.confidence = match.group(field).lower()
+                elif field == "prio":
+                    priority = match.group(field).lower()
+                    agent.status = "blocked" if priority == "critical" else "active"
+                else:
+                    # Blockers run until the next heading marker
+                    blocked = True
+                    blocker_section = _section(content, match.group(field), match.start())
+                    agent.blockers = [line.strip() for line in blocker_section.split('\n') if line.strip()]
+                    
+                if len(seen) == 4:
+                    break
+                    
+            # A blockers section overrides the priority-derived status
+            if blocked:
                 agent.status = "blocked"
-                blocker_section = content.split("## 🚨 Blockers")[1].split("##")[0]
-                agent.blockers = [line.strip() for line in blocker_section.split('\n') if line.strip()]
                 
             # Set last update time from file modification
-            agent.last_update = datetime.fromtimestamp(os.path.getmtime(handoff_file))
+            if mtime is None:
+                mtime = os.path.getmtime(handoff_file)
+            agent.last_update_ts = mtime
+            agent.last_update = datetime.fromtimestamp(mtime)
             
         except Exception as e:
             print(f"Error parsing handoff file {handoff_file}: {e}", file=sys.stderr)
@@ -81,81 +181,154 @@ class ReviewItem:
         
     @property
     def priority_icon(self) -> str:
-        return {"critical": "🚨", "high": "🟡", "medium": "🟢"}.get(self.priority, "🟢")
+        return _PRIORITY_ICON.get(self.priority, "🟢")
 
 class AgentManager:
     """Main TUI application for agent management"""
     
     def __init__(self):
         self.agents: Dict[str, AgentStatus] = {}
+        self._agents_list: List[AgentStatus] = []  # agents.values() snapshot for drawing
+        self._status_summary: Counter = Counter(dict.fromkeys(_AGENT_STATUSES, 0))
         self.review_items: List[ReviewItem] = []
         self.current_pane = 0  # 0=agents, 1=tasks, 2=review
         self.selected_agent = 0
         self.selected_review = 0
         self.status_message = "Agent Manager Ready"
         self.last_refresh = datetime.now()
+        self.refresh_interval = timedelta(minutes=1)  # Auto-refresh cadence
+        self._dirty = True  # Set when anything shown on screen changed
+        self._now = datetime.now()  # Sampled once per frame for "time ago" text
         
         # Paths
         self.handoff_pattern = "handoff-*.md"
+        self._handoff_re = re.compile(fnmatch.translate(self.handoff_pattern))
         self.review_file = "docs/sprints/human-review.md"
+        self.sprint_file = "docs/sprints/current-sprint.md"
         self.decisions_dir = ".decisions"
+        self.quick_approve_script = "docs/scaffolding/human-review/quick-approve.sh"
         
-        # Ensure decisions directory exists
-        os.makedirs(self.decisions_dir, exist_ok=True)
+        # Checked once; approvals skip the stat and the fork when it is absent
+        self._quick_approve_exists = os.path.exists(self.quick_approve_script)
+        
+        # Parsed handoff files keyed by path: (mtime, size, AgentStatus)
+        self._handoff_cache: Dict[str, Tuple[float, int, AgentStatus]] = {}
+        
+        # (mtime_ns, size) of the sprint and review files as last parsed
+        self._sprint_stamp: Optional[Tuple[int, int]] = None
+        self._sprint_ownership: List[Tuple[str, List[str]]] = []
+        self._review_stamp: Optional[Tuple[int, int]] = None
+        
+        # Decisions directory is created on the first approval
+        self._decisions_dir_ready = False
         
     def discover_agents(self):
         """Discover agents from handoff files and sprint assignments"""
         self.agents.clear()
         
         # Discover from handoff files
-        handoff_files = glob.glob(self.handoff_pattern)
-        for handoff_file in sorted(handoff_files, key=os.path.getmtime, reverse=True):
-            agent = AgentStatus.from_handoff_file(handoff_file)
+        # One directory read; DirEntry.stat() reuses it for the mtime sort
+        with os.scandir('.') as it:
+            entries = [(e.name, e.stat()) for e in it
+                       if self._handoff_re.match(e.name) and e.is_file()]
+        entries.sort(key=lambda entry: entry[1].st_mtime, reverse=True)
+        handoff_files = [name for name, _ in entries]
+        
+        # Only re-read files whose mtime or size changed since the last refresh
+        stale = []
+        for handoff_file, st in entries:
+            cached = self._handoff_cache.get(handoff_file)
+            if not (cached and cached[0] == st.st_mtime and cached[1] == st.st_size):
+                stale.append((handoff_file, st))
+                
+        # Reads are I/O bound; parse the stale subset concurrently
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(8, len(stale))) as pool:
+                parsed = pool.map(
+                    lambda entry: AgentStatus.from_handoff_file(entry[0], entry[1].st_mtime, entry[1].st_size),
+                    stale)
+                for (handoff_file, st), agent in zip(stale, parsed):
+                    self._handoff_cache[handoff_file] = (st.st_mtime, st.st_size, agent)
+                    
+        # Merge in newest-first order so the newest file wins per agent
+        for handoff_file, _ in entries:
+            agent = self._handoff_cache[handoff_file][2]
             if agent.agent_id not in self.agents:
                 self.agents[agent.agent_id] = agent
                 
+        # Forget files that have been removed
+        for removed in self._handoff_cache.keys() - set(handoff_files):
+            del self._handoff_cache[removed]
+                
         # Discover from sprint file if available
-        if os.path.exists("docs/sprints/current-sprint.md"):
+        if os.path.exists(self.sprint_file):
             try:
-                with open("docs/sprints/current-sprint.md", 'r') as f:
-                    content = f.read()
+                for agent_id, files_owned in self._load_sprint_ownership():
+                    if agent_id not in self.agents:
+                        self.agents[agent_id] = AgentStatus(agent_id)
                     
-                # Extract agent assignments
-                if "## 🗂️ File Ownership" in content:
-                    ownership_section = content.split("## 🗂️ File Ownership")[1].split("##")[0]
-                    for line in ownership_section.split('\n'):
-                        if match := re.search(r'\*\*Agent (\d+)\*\*: `([^`]+)`', line):
-                            agent_id = f"agent-{match.group(1)}"
-                            files = match.group(2)
-                            
-                            if agent_id not in self.agents:
-                                self.agents[agent_id] = AgentStatus(agent_id)
-                            
-                            self.agents[agent_id].files_owned = [f.strip() for f in files.split(',')]
-                            
-                            # Determine status from recent activity
-                            if agent_id not in [a.agent_id for a in self.agents.values() if a.last_update]:
-                                self.agents[agent_id].status = "idle"
-                                self.agents[agent_id].current_task = "No recent activity"
-                                
+                    self.agents[agent_id].files_owned = list(files_owned)
+                    
+                    # Determine status from recent activity
+                    if agent_id not in [a.agent_id for a in self.agents.values() if a.last_update]:
+                        self.agents[agent_id].status = "idle"
+                        self.agents[agent_id].current_task = "No recent activity"
+                        
             except Exception as e:
                 self.status_message = f"Error reading sprint file: {e}"
                 
         # If no agents found, create default set
         if not self.agents:
             for i in range(1, 7):
-                agent_id = f"agent-{i}"
+                agent_id = sys.intern(f"agent-{i}")
                 self.agents[agent_id] = AgentStatus(agent_id)
                 self.agents[agent_id].status = "idle"
                 self.agents[agent_id].current_task = "No active tasks"
                 
-    def load_review_queue(self):
-        """Load items from human review queue"""
-        self.review_items.clear()
+        self._agents_list = list(self.agents.values())
+        self._status_summary = Counter(dict.fromkeys(_AGENT_STATUSES, 0))
+        self._status_summary.update(agent.status for agent in self._agents_list)
+        
+    def _load_sprint_ownership(self) -> List[Tuple[str, List[str]]]:
+        """Agent file-ownership rows from the sprint file, re-parsed only when it changes"""
+        st = os.stat(self.sprint_file)
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self._sprint_stamp:
+            return self._sprint_ownership
+            
+        with open(self.sprint_file, 'r') as f:
+            content = f.read()
+            
+        # Extract agent assignments
+        ownership = []
+        ownership_section = _section(content, "## 🗂️ File Ownership")
+        if ownership_section is not None:
+            for line in ownership_section.split('\n'):
+                if match := _RE_OWN.search(line):
+                    agent_id = sys.intern(f"agent-{match.group(1)}")
+                    files = match.group(2)
+                    ownership.append((agent_id, [sys.intern(f.strip()) for f in files.split(',')]))
+                    
+        self._sprint_ownership = ownership
+        self._sprint_stamp = stamp
+        return ownership
         
-        if not os.path.exists(self.review_file):
+    def load_review_queue(self):
+        """Load items from human review queue (kept as-is while the file is unchanged)"""
+        try:
+            st = os.stat(self.review_file)
+        except OSError:
+            self.review_items.clear()
+            self._review_stamp = None
             return
             
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self._review_stamp:
+            return
+            
+        self.review_items.clear()
+        self._review_stamp = None
+        
         try:
             with open(self.review_file, 'r') as f:
                 content = f.read()
@@ -166,46 +339,53 @@ class AgentManager:
                 ("high", "🟡 HIGH PRIORITY"),
                 ("medium", "🟢 MEDIUM PRIORITY")
             ]:
-                if section_marker in content:
-                    section = content.split(section_marker)[1].split("##")[0]
+                section = _section(content, section_marker)
+                if section is not None:
                     for line in section.split('\n'):
-                        if match := re.search(r'- \*\*\[([^\]]+)\]\*\* - (.+)', line):
+                        if match := _RE_REVIEW.search(line):
                             agent_id = match.group(1)
                             description = match.group(2)
                             
                             item = ReviewItem(agent_id, description, priority)
                             self.review_items.append(item)
                             
+            self._review_stamp = stamp
+            
         except Exception as e:
             self.status_message = f"Error loading review queue: {e}"
             
+        # Sort once per load; panes and actions index the list directly
+        self.review_items.sort(key=lambda x: _PRIORITY_ORDER.get(x.priority, 3))
+        self._dirty = True
+            
     def get_agent_status_summary(self) -> Dict[str, int]:
-        """Get summary of agent statuses"""
-        summary = {"active": 0, "blocked": 0, "completed": 0, "idle": 0}
-        for agent in self.agents.values():
-            summary[agent.status] = summary.get(agent.status, 0) + 1
-        return summary
+        """Get summary of agent statuses (counted once per discovery)"""
+        return self._status_summary
         
-    def get_stale_agents(self, hours: int = 2) -> List[AgentStatus]:
+    def get_stale_agents(self, hours: int = 2, now: Optional[datetime] = None) -> List[AgentStatus]:
         """Get agents with no activity for specified hours"""
-        cutoff = datetime.now() - timedelta(hours=hours)
-        return [agent for agent in self.agents.values() 
-                if agent.last_update and agent.last_update < cutoff]
+        cutoff = (now.timestamp() if now else time.time()) - hours * 3600
+        return [agent for agent in self.agents.values()
+                if agent.last_update_ts and agent.last_update_ts < cutoff]
                 
     def approve_agent_request(self, agent_id: str, decision: str, reason: str = ""):
         """Approve/block an agent request"""
         try:
+            if not self._decisions_dir_ready:
+                os.makedirs(self.decisions_dir, exist_ok=True)
+                self._decisions_dir_ready = True
+                
             decision_file = os.path.join(self.decisions_dir, f"{agent_id}-decision")
             with open(decision_file, 'w') as f:
-                f.write(f"DECISION: {decision}\n")
-                f.write(f"REASON: {reason}\n")
-                f.write(f"TIMESTAMP: {datetime.now().isoformat()}\n")
-                f.write(f"STATUS: active\n")
+                f.write(f"DECISION: {decision}\n"
+                        f"REASON: {reason}\n"
+                        f"TIMESTAMP: {datetime.now().isoformat()}\n"
+                        f"STATUS: active\n")
                 
             # Remove from review queue by calling quick-approve script
-            if os.path.exists("docs/scaffolding/human-review/quick-approve.sh"):
+            if self._quick_approve_exists:
                 subprocess.run([
-                    "docs/scaffolding/human-review/quick-approve.sh",
+                    self.quick_approve_script,
                     agent_id, decision, reason
                 ], capture_output=True)
                 
@@ -222,6 +402,7 @@ class AgentManager:
         self.load_review_queue()
         self.last_refresh = datetime.now()
         self.status_message = f"Refreshed at {self.last_refresh.strftime('%H:%M:%S')}"
+        self._dirty = True
         
     def draw_header(self, stdscr, height: int, width: int):
         """Draw the header with title and status"""
@@ -229,12 +410,12 @@ class AgentManager:
         status_summary = self.get_agent_status_summary()
         
         # Title line
-        stdscr.addstr(0, 0, title[:width-1], curses.A_BOLD)
+        stdscr.addnstr(0, 0, title, width-1, curses.A_BOLD)
         
         # Status line
         status_line = f"Active: {status_summary['active']} | Blocked: {status_summary['blocked']} | " \
                      f"Review Items: {len(self.review_items)} | Last Refresh: {self.last_refresh.strftime('%H:%M:%S')}"
-        stdscr.addstr(1, 0, status_line[:width-1])
+        stdscr.addnstr(1, 0, status_line, width-1)
         
         # Separator
         stdscr.addstr(2, 0, "─" * width)
@@ -249,27 +430,17 @@ class AgentManager:
             
         y = start_y + 1
         
-        agents_list = list(self.agents.values())
+        agents_list = self._agents_list
         for i, agent in enumerate(agents_list[:height-2]):
-            status_icon = {
-                "active": "🟢",
-                "blocked": "🔴", 
-                "completed": "✅",
-                "idle": "⚪"
-            }.get(agent.status, "❓")
-            
-            confidence_icon = {
-                "high": "🟢",
-                "medium": "🟡", 
-                "low": "🔴"
-            }.get(agent.confidence, "🟡")
+            status_icon = _STATUS_ICON.get(agent.status, "❓")
+            confidence_icon = _CONF_ICON.get(agent.confidence, "🟡")
             
             line = f"{status_icon} {agent.agent_id:<10} {confidence_icon}"
             
             if is_active and i == self.selected_agent:
-                stdscr.addstr(y + i, 0, line[:width-1], curses.A_REVERSE)
+                stdscr.addnstr(y + i, 0, line, width-1, curses.A_REVERSE)
             else:
-                stdscr.addstr(y + i, 0, line[:width-1])
+                stdscr.addnstr(y + i, 0, line, width-1)
                 
     def draw_tasks_pane(self, stdscr, start_y: int, height: int, width: int, is_active: bool):
         """Draw the current tasks pane"""
@@ -281,37 +452,22 @@ class AgentManager:
             
         y = start_y + 1
         
-        agents_list = list(self.agents.values())
+        agents_list = self._agents_list
         if agents_list and self.selected_agent < len(agents_list):
             selected_agent = agents_list[self.selected_agent]
             
-            # Show selected agent's current task
-            task_lines = [
-                f"Agent: {selected_agent.agent_id}",
-                f"Status: {selected_agent.status}",
-                f"Task: {selected_agent.current_task[:width-10]}",
-                f"Confidence: {selected_agent.confidence}",
-                ""
-            ]
-            
+            # Show selected agent's current task; the time ago is keyed at
+            # minute resolution, so the block is reformatted at most once a minute
+            minutes_ago = None
             if selected_agent.last_update:
-                time_ago = datetime.now() - selected_agent.last_update
-                task_lines.append(f"Last Update: {time_ago.seconds//3600}h {(time_ago.seconds//60)%60}m ago")
-            else:
-                task_lines.append("Last Update: Unknown")
+                minutes_ago = (self._now - selected_agent.last_update).seconds // 60
+            task_lines = _format_agent_block(
+                selected_agent.agent_id, selected_agent.status, selected_agent.current_task,
+                selected_agent.confidence, minutes_ago, tuple(selected_agent.files_owned),
+                tuple(selected_agent.blockers), width)
                 
-            if selected_agent.files_owned:
-                task_lines.append("Files Owned:")
-                for file_path in selected_agent.files_owned[:3]:
-                    task_lines.append(f"  {file_path}")
-                    
-            if selected_agent.blockers:
-                task_lines.append("Blockers:")
-                for blocker in selected_agent.blockers[:2]:
-                    task_lines.append(f"  {blocker[:width-5]}")
-                    
             for i, line in enumerate(task_lines[:height-2]):
-                stdscr.addstr(y + i, 0, line[:width-1])
+                stdscr.addstr(y + i, 0, line)
                 
     def draw_review_pane(self, stdscr, start_y: int, height: int, width: int, is_active: bool):
         """Draw the review queue pane"""
@@ -323,17 +479,13 @@ class AgentManager:
             
         y = start_y + 1
         
-        # Sort review items by priority
-        priority_order = {"critical": 0, "high": 1, "medium": 2}
-        sorted_items = sorted(self.review_items, key=lambda x: priority_order.get(x.priority, 3))
-        
-        for i, item in enumerate(sorted_items[:height-2]):
+        for i, item in enumerate(self.review_items[:height-2]):
             line = f"{item.priority_icon} {item.agent_id}: {item.description[:width-15]}"
             
             if is_active and i == self.selected_review:
-                stdscr.addstr(y + i, 0, line[:width-1], curses.A_REVERSE)
+                stdscr.addnstr(y + i, 0, line, width-1, curses.A_REVERSE)
             else:
-                stdscr.addstr(y + i, 0, line[:width-1])
+                stdscr.addnstr(y + i, 0, line, width-1)
                 
     def draw_details_pane(self, stdscr, start_y: int, height: int, width: int):
         """Draw the details pane at the bottom"""
@@ -343,11 +495,8 @@ class AgentManager:
         y = start_y + 1
         
         if self.current_pane == 2 and self.review_items:  # Review pane active
-            priority_order = {"critical": 0, "high": 1, "medium": 2}
-            sorted_items = sorted(self.review_items, key=lambda x: priority_order.get(x.priority, 3))
-            
-            if self.selected_review < len(sorted_items):
-                item = sorted_items[self.selected_review]
+            if self.selected_review < len(self.review_items):
+                item = self.review_items[self.selected_review]
                 details = [
                     f"Agent: {item.agent_id}",
                     f"Priority: {item.priority}",
@@ -358,10 +507,10 @@ class AgentManager:
                 ]
                 
                 for i, line in enumerate(details[:height-2]):
-                    stdscr.addstr(y + i, 0, line[:width-1])
+                    stdscr.addnstr(y + i, 0, line, width-1)
                     
         elif self.current_pane == 0 and self.agents:  # Agents pane active
-            agents_list = list(self.agents.values())
+            agents_list = self._agents_list
             if self.selected_agent < len(agents_list):
                 agent = agents_list[self.selected_agent]
                 details = [
@@ -374,7 +523,7 @@ class AgentManager:
                 ]
                 
                 for i, line in enumerate(details[:height-2]):
-                    stdscr.addstr(y + i, 0, line[:width-1])
+                    stdscr.addnstr(y + i, 0, line, width-1)
         else:
             stdscr.addstr(y, 0, "No details available")
             stdscr.addstr(y + 2, 0, "Navigation: [Tab] switch panes [q] quit [r] refresh")
@@ -383,11 +532,13 @@ class AgentManager:
         """Draw the footer with status message and controls"""
         controls = "[q]uit [r]efresh [Tab] switch [h]elp"
         stdscr.addstr(start_y, 0, "─" * width)
-        stdscr.addstr(start_y + 1, 0, f"Status: {self.status_message}"[:width-1])
-        stdscr.addstr(start_y + 2, 0, controls[:width-1], curses.A_DIM)
+        stdscr.addnstr(start_y + 1, 0, f"Status: {self.status_message}", width-1)
+        stdscr.addnstr(start_y + 2, 0, controls, width-1, curses.A_DIM)
         
     def handle_input(self, key: int) -> bool:
         """Handle keyboard input. Returns False to quit."""
+        # Keys that change nothing (unbound, or moving past a list end) don't redraw
+        view = (self.current_pane, self.selected_agent, self.selected_review, self.status_message)
         
         # Global shortcuts
         if key == ord('q'):
@@ -420,6 +571,8 @@ class AgentManager:
             elif key == ord('d'):
                 self.approve_current_item("deferred", "Deferred via TUI")
                 
+        if view != (self.current_pane, self.selected_agent, self.selected_review, self.status_message):
+            self._dirty = True
         return True
         
     def approve_current_item(self, decision: str, reason: str):
@@ -427,11 +580,8 @@ class AgentManager:
         if not self.review_items:
             return
             
-        priority_order = {"critical": 0, "high": 1, "medium": 2}
-        sorted_items = sorted(self.review_items, key=lambda x: priority_order.get(x.priority, 3))
-        
-        if self.selected_review < len(sorted_items):
-            item = sorted_items[self.selected_review]
+        if self.selected_review < len(self.review_items):
+            item = self.review_items[self.selected_review]
             if self.approve_agent_request(item.agent_id, decision, reason):
                 # Refresh to update display
                 self.load_review_queue()
@@ -447,53 +597,107 @@ class AgentManager:
         """Main TUI loop"""
         # Initialize curses
         curses.curs_set(0)  # Hide cursor
-        stdscr.timeout(1000)  # 1 second timeout for getch
+        stdscr.nodelay(True)  # Waiting happens in select(), getch only drains keys
+        
+        # SIGWINCH reaches select() through a self-pipe; a Python-level handler
+        # is required for the wakeup fd to be written
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_r, False)
+        os.set_blocking(wake_w, False)
+        previous_wakeup_fd = signal.set_wakeup_fd(wake_w)
+        previous_winch = signal.signal(signal.SIGWINCH, lambda signum, frame: None)
+        
+        try:
+            self._event_loop(stdscr, wake_r)
+        finally:
+            signal.signal(signal.SIGWINCH, previous_winch if previous_winch is not None else signal.SIG_DFL)
+            signal.set_wakeup_fd(previous_wakeup_fd)
+            os.close(wake_r)
+            os.close(wake_w)
+            
+    def _resize_terminal(self):
+        """Apply a terminal resize now that curses' own SIGWINCH handler is replaced"""
+        try:
+            columns, lines = os.get_terminal_size(sys.__stdout__.fileno())
+            curses.resizeterm(lines, columns)
+        except (OSError, curses.error):
+            pass
+        self._dirty = True
         
+    def _event_loop(self, stdscr, wake_r: int):
+        """Draw when needed, then sleep until a key, a resize or the next auto-refresh"""
         # Initial data load
         self.refresh_data()
         
+        last_frame = None
+        
         while True:
             # Get screen dimensions
             height, width = stdscr.getmaxyx()
-            stdscr.clear()
-            
-            # Calculate pane dimensions
-            header_height = 3
-            footer_height = 3
-            available_height = height - header_height - footer_height
-            
-            pane_height = available_height // 2
-            details_height = available_height - pane_height
-            
-            pane_width = width // 3
-            
-            # Draw all components
-            self.draw_header(stdscr, height, width)
             
-            # Top row panes
-            self.draw_agents_pane(stdscr, header_height, pane_height, pane_width, self.current_pane == 0)
-            self.draw_tasks_pane(stdscr, header_height, pane_height, pane_width, self.current_pane == 1)
-            self.draw_review_pane(stdscr, header_height, pane_height, pane_width, self.current_pane == 2)
-            
-            # Details pane
-            details_start = header_height + pane_height
-            self.draw_details_pane(stdscr, details_start, details_height, width)
-            
-            # Footer
-            footer_start = height - footer_height
-            self.draw_footer(stdscr, footer_start, width)
-            
-            stdscr.refresh()
+            # Idle frames only change when the size or the minute-resolution
+            # "time ago" text does; state changes mark the frame dirty
+            self._now = datetime.now()
+            frame = (height, width, self._now.replace(second=0, microsecond=0))
+            if self._dirty or frame != last_frame:
+                self.draw_frame(stdscr, height, width)
+                self._dirty = False
+                last_frame = frame
+                
+            # Sleep until a keypress, a resize or the auto-refresh deadline
+            timeout = (self.last_refresh + self.refresh_interval - self._now).total_seconds()
+            ready, _, _ = select.select([sys.stdin.fileno(), wake_r], [], [], max(0.0, timeout))
             
-            # Handle input
-            key = stdscr.getch()
-            if key != -1:  # Key was pressed
+            if wake_r in ready:
+                try:
+                    while os.read(wake_r, 512):
+                        pass
+                except OSError:
+                    pass
+                self._resize_terminal()
+                
+            # Handle every buffered key
+            while (key := stdscr.getch()) != -1:
                 if not self.handle_input(key):
-                    break
+                    return
                     
             # Auto-refresh every minute
-            if datetime.now() - self.last_refresh > timedelta(minutes=1):
+            if datetime.now() - self.last_refresh >= self.refresh_interval:
                 self.refresh_data()
+                
+    def draw_frame(self, stdscr, height: int, width: int):
+        """Draw every pane and push only the changed cells to the terminal"""
+        # erase() keeps curses' screen model, unlike clear() which forces a full repaint
+        stdscr.erase()
+        
+        # Calculate pane dimensions
+        header_height = 3
+        footer_height = 3
+        available_height = height - header_height - footer_height
+        
+        pane_height = available_height // 2
+        details_height = available_height - pane_height
+        
+        pane_width = width // 3
+        
+        # Draw all components
+        self.draw_header(stdscr, height, width)
+        
+        # Top row panes
+        self.draw_agents_pane(stdscr, header_height, pane_height, pane_width, self.current_pane == 0)
+        self.draw_tasks_pane(stdscr, header_height, pane_height, pane_width, self.current_pane == 1)
+        self.draw_review_pane(stdscr, header_height, pane_height, pane_width, self.current_pane == 2)
+        
+        # Details pane
+        details_start = header_height + pane_height
+        self.draw_details_pane(stdscr, details_start, details_height, width)
+        
+        # Footer
+        footer_start = height - footer_height
+        self.draw_footer(stdscr, footer_start, width)
+        
+        stdscr.noutrefresh()
+        curses.doupdate()
 
 def main():
     """Main entry point"""
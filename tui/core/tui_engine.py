@@ -12,12 +12,15 @@ Key features:
 """
 
 import curses
+import json
+import os
+import selectors
 import signal
 import sys
+import time
 import traceback
 import logging
-from typing import Callable, Optional, Dict, Any
-from dataclasses import dataclass
+from typing import Callable, Optional, Dict, Any, List, NamedTuple, Tuple
 from enum import Enum
 
 class TUIError(Exception):
@@ -32,9 +35,28 @@ class TUIState(Enum):
     ERROR = "error"
     SHUTTING_DOWN = "shutting_down"
 
-@dataclass
-class TerminalInfo:
-    """Terminal environment information"""
+# Color pairs by number: (foreground, background); -1 is the terminal default
+_COLOR_PAIR_DEFS = {
+    1: (curses.COLOR_RED, -1),      # Error
+    2: (curses.COLOR_GREEN, -1),    # Success
+    3: (curses.COLOR_YELLOW, -1),   # Warning
+    4: (curses.COLOR_BLUE, -1),     # Info
+    5: (curses.COLOR_CYAN, -1),     # Highlight
+    6: (curses.COLOR_MAGENTA, -1),  # Special
+}
+
+# Color names accepted by get_color_pair, mapped to their curses pair numbers
+_COLOR_PAIR_NUMBERS = {
+    'error': 1, 'red': 1,
+    'success': 2, 'green': 2,
+    'warning': 3, 'yellow': 3,
+    'info': 4, 'blue': 4,
+    'highlight': 5, 'cyan': 5,
+    'special': 6, 'magenta': 6
+}
+
+class TerminalInfo(NamedTuple):
+    """Terminal environment information (immutable; resize swaps in a copy)"""
     height: int
     width: int
     colors_supported: bool
@@ -59,8 +81,18 @@ class TUIEngine:
         self.state = TUIState.INITIALIZING
         self.stdscr: Optional[curses.window] = None
         self.terminal_info: Optional[TerminalInfo] = None
+        # Plain-int copy of terminal_info's size for the safe_addstr hot path
+        self._h = 0
+        self._w = 0
         self.resize_pending = False
         self.shutdown_requested = False
+        self._shutdown_signal: Optional[int] = None  # Logged from the main loop, not the handler
+        self.screen_cleared = False  # Set when the engine wipes the screen; draw handlers must repaint all
+        self._recovery_pending = False  # A cleared-screen repaint after a curses error is due
+        
+        # Drag-resizes fire bursts of SIGWINCH; handle at most one per interval
+        self.resize_coalesce_interval = 0.05
+        self._last_resize_ts = 0.0
         self.error_count = 0
         self.max_errors = 5
         
@@ -69,6 +101,23 @@ class TUIEngine:
         self.input_handler: Optional[Callable] = None
         self.resize_handler: Optional[Callable] = None
         self.error_handler: Optional[Callable] = None
+        self.wait_handler: Optional[Callable[[], Tuple[Optional[float], List[int]]]] = None
+        
+        # Event wakeup: the loop sleeps in a selector on stdin, a signal
+        # self-pipe and any handler-supplied fds until the next deadline;
+        # idle_timeout is only a safety backstop when no handler gives one
+        self.idle_timeout = 1.0
+        self._wakeup_r: Optional[int] = None
+        self._wakeup_w: Optional[int] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._previous_wakeup_fd = -1
+        self._input_ready = True
+        self.max_keys_per_tick = 256  # Bound a paste burst so drawing is not starved
+        
+        # Resolved curses attributes per color name; pairs are initialized
+        # on first use rather than all at startup
+        self._color_pairs: Dict[str, int] = {}
+        self._colors_enabled = False
         
         # State preservation
         self.preserved_state: Dict[str, Any] = {}
@@ -79,22 +128,26 @@ class TUIEngine:
     def _setup_logging(self):
         """Configure logging for TUI operations"""
         log_level = logging.DEBUG if self.debug else logging.WARNING
+        # delay=True: the log file is only opened by the first record that
+        # passes the level, so quiet non-debug runs never touch the disk
         logging.basicConfig(
-            filename='tui_engine.log',
+            handlers=[logging.FileHandler('tui_engine.log', mode='a', delay=True)],
             level=log_level,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            filemode='a'
+            format='%(asctime)s - %(levelname)s - %(message)s'
         )
         self.logger = logging.getLogger(__name__)
         
     def _signal_handler(self, signum, frame):
-        """Handle system signals"""
+        """Handle system signals
+        
+        Only sets flags: the handler can interrupt the main loop anywhere,
+        including inside a logging call, so logging is left to the loop.
+        """
         if signum == signal.SIGWINCH:
             self.resize_pending = True
-            self.logger.debug("Terminal resize signal received")
         elif signum in (signal.SIGINT, signal.SIGTERM):
             self.shutdown_requested = True
-            self.logger.info(f"Shutdown signal {signum} received")
+            self._shutdown_signal = signum
             
     def _detect_terminal_capabilities(self) -> TerminalInfo:
         """Detect terminal capabilities and limitations"""
@@ -104,16 +157,17 @@ class TUIEngine:
             # Test color support
             colors_supported = curses.has_colors() and curses.can_change_color()
             
-            # Test unicode support (basic test)
+            # Test unicode support (basic test). addstr encodes eagerly, so
+            # the probe fails here without a refresh round-trip; the cell is
+            # blanked again before anything reaches the terminal
             unicode_supported = True
             try:
                 self.stdscr.addstr(0, 0, "✓")
-                self.stdscr.refresh()
+                self.stdscr.addstr(0, 0, " ")
             except (UnicodeEncodeError, curses.error):
                 unicode_supported = False
                 
             # Get platform and terminal type
-            import os
             platform = os.name
             term_type = os.environ.get('TERM', 'unknown')
             
@@ -145,25 +199,23 @@ class TUIEngine:
             curses.cbreak()         # React to keys without Enter
             curses.curs_set(0)      # Hide cursor
             self.stdscr.keypad(True)  # Enable special keys
-            self.stdscr.timeout(100)  # Non-blocking input with 100ms timeout
+            self.stdscr.leaveok(True)  # Don't reposition the hidden cursor
+            # Waiting happens in the selector; fall back to a 100ms getch timeout
+            # when stdin cannot be selected on
+            self.stdscr.timeout(0 if self._wakeup_r is not None else 100)
             
             # Initialize colors if supported
             if curses.has_colors():
                 curses.start_color()
                 curses.use_default_colors()
-                
-                # Define color pairs
-                curses.init_pair(1, curses.COLOR_RED, -1)     # Error
-                curses.init_pair(2, curses.COLOR_GREEN, -1)   # Success
-                curses.init_pair(3, curses.COLOR_YELLOW, -1)  # Warning
-                curses.init_pair(4, curses.COLOR_BLUE, -1)    # Info
-                curses.init_pair(5, curses.COLOR_CYAN, -1)    # Highlight
-                curses.init_pair(6, curses.COLOR_MAGENTA, -1) # Special
+                self._colors_enabled = True
+            self._color_pairs = {}
                 
             # Detect terminal capabilities
             self.terminal_info = self._detect_terminal_capabilities()
+            self._h, self._w = self.terminal_info.height, self.terminal_info.width
             
-            self.logger.info(f"Terminal initialized: {self.terminal_info}")
+            self.logger.info("Terminal initialized: %s", self.terminal_info)
             
         except Exception as e:
             self.logger.error(f"Failed to initialize curses: {e}")
@@ -184,19 +236,36 @@ class TUIEngine:
         except Exception as e:
             self.logger.warning(f"Error during curses cleanup: {e}")
             
+    def _terminal_size(self) -> Tuple[int, int]:
+        """Current (lines, columns) from the tty; curses only learns it via resizeterm"""
+        try:
+            columns, lines = os.get_terminal_size(sys.__stdout__.fileno())
+            return lines, columns
+        except (OSError, AttributeError, ValueError):
+            return self.stdscr.getmaxyx()
+            
     def _handle_resize(self):
         """Handle terminal resize events"""
+        # Coalesce signal storms: leave resize_pending set and retry next tick
+        now = time.monotonic()
+        if now - self._last_resize_ts < self.resize_coalesce_interval:
+            return
+        self._last_resize_ts = now
+        
         try:
             # Get new terminal size
             self.stdscr.clear()
-            curses.resizeterm(*self.stdscr.getmaxyx())
+            self.screen_cleared = True
+            curses.resizeterm(*self._terminal_size())
             
-            # Update terminal info
+            # Only the size changes on resize; colors/unicode/platform stay as probed
             old_info = self.terminal_info
-            self.terminal_info = self._detect_terminal_capabilities()
+            height, width = self.stdscr.getmaxyx()
+            self.terminal_info = old_info._replace(height=height, width=width)
+            self._h, self._w = height, width
             
-            self.logger.info(f"Terminal resized: {old_info.width}x{old_info.height} → "
-                           f"{self.terminal_info.width}x{self.terminal_info.height}")
+            self.logger.info("Terminal resized: %sx%s → %sx%s",
+                             old_info.width, old_info.height, width, height)
             
             # Call resize handler if registered
             if self.resize_handler:
@@ -212,18 +281,28 @@ class TUIEngine:
         """Safely execute draw handler with error boundaries"""
         try:
             if self.draw_handler and self.stdscr:
-                self.draw_handler(self.stdscr, self.terminal_info)
-                self.stdscr.refresh()
+                # A wiped screen must be flushed even if the handler drew nothing
+                must_flush = self.screen_cleared
+                drawn = self.draw_handler(self.stdscr, self.terminal_info)
+                # Single batched terminal write per frame, skipped when the
+                # handler reports (by returning False) that nothing changed
+                if drawn is not False or must_flush:
+                    self.stdscr.noutrefresh()
+                    curses.doupdate()
+                self._recovery_pending = False
                 
         except curses.error as e:
             self.logger.warning(f"Curses drawing error: {e}")
-            # Try to recover by clearing and redrawing
+            if self._recovery_pending:
+                # The repaint on a cleared screen failed as well
+                self.error_count += 1
+            # Recover by clearing and letting the next frame repaint
+            # everything, rather than drawing twice in this one
             try:
                 self.stdscr.clear()
-                if self.draw_handler:
-                    self.draw_handler(self.stdscr, self.terminal_info)
-                    self.stdscr.refresh()
-            except:
+                self.screen_cleared = True
+                self._recovery_pending = True
+            except curses.error:
                 self.error_count += 1
                 
         except Exception as e:
@@ -232,18 +311,120 @@ class TUIEngine:
             if self.error_handler:
                 self.error_handler(e)
                 
+    def _install_wakeup_fd(self):
+        """Route signal delivery into a self-pipe so the selector wakes on SIGWINCH/SIGTERM"""
+        try:
+            os.fstat(sys.stdin.fileno())
+            self._wakeup_r, self._wakeup_w = os.pipe()
+            os.set_blocking(self._wakeup_r, False)
+            os.set_blocking(self._wakeup_w, False)
+            self._previous_wakeup_fd = signal.set_wakeup_fd(self._wakeup_w)
+            # stdin and the pipe stay registered for the whole session
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(sys.stdin.fileno(), selectors.EVENT_READ)
+            self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+        except (OSError, ValueError, AttributeError) as e:
+            # No selectable stdin or not on the main thread: keep getch polling
+            self.logger.debug("select-driven input unavailable: %s", e)
+            self._remove_wakeup_fd()
+            
+    def _remove_wakeup_fd(self):
+        """Restore the previous wakeup fd and close the self-pipe"""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        if self._wakeup_w is not None:
+            try:
+                signal.set_wakeup_fd(self._previous_wakeup_fd)
+            except (OSError, ValueError):
+                pass
+        for fd in (self._wakeup_r, self._wakeup_w):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._wakeup_r = self._wakeup_w = None
+        
+    def _wait_for_events(self):
+        """Sleep until a key, a signal, a watched fd or the next deadline"""
+        if self._wakeup_r is None or self._input_ready:
+            # Polling mode, or curses may still hold buffered keys
+            return
+            
+        timeout = self.idle_timeout
+        watch_fds: List[int] = []
+        if self.wait_handler:
+            try:
+                handler_timeout, watch_fds = self.wait_handler()
+                if handler_timeout is not None:
+                    timeout = max(0.0, handler_timeout)
+            except Exception as e:
+                self.logger.warning(f"Error in wait handler: {e}")
+                
+        # A coalesced resize or an error recovery repaint is due shortly
+        if self.resize_pending or self._recovery_pending:
+            timeout = min(timeout, self.resize_coalesce_interval)
+            
+        # Handler fds come and go (and fd numbers get reused), so they are
+        # only registered for the duration of this wait
+        registered = []
+        for fd in watch_fds:
+            try:
+                self._selector.register(fd, selectors.EVENT_READ)
+                registered.append(fd)
+            except (KeyError, OSError, ValueError) as e:
+                # Already closed, or a duplicate of a registered fd
+                self.logger.debug("Cannot watch fd %s: %s", fd, e)
+                
+        try:
+            ready = {key.fd for key, _ in self._selector.select(timeout)}
+        except (OSError, ValueError) as e:
+            self.logger.debug("select failed: %s", e)
+            ready = set()
+        finally:
+            for fd in registered:
+                try:
+                    self._selector.unregister(fd)
+                except (KeyError, OSError, ValueError):
+                    pass
+                    
+        if self._wakeup_r in ready:
+            try:
+                while os.read(self._wakeup_r, 512):
+                    pass
+            except (BlockingIOError, OSError):
+                pass
+        if sys.stdin.fileno() in ready:
+            self._input_ready = True
+            
     def _safe_input(self):
-        """Safely handle input with error boundaries"""
+        """Safely handle input with error boundaries
+        
+        Drains every pending key before returning, so a paste or key
+        repeat burst costs one frame instead of one frame per key.
+        """
         try:
             if not self.stdscr:
                 return None
                 
-            key = self.stdscr.getch()
-            
-            if key != -1 and self.input_handler:  # -1 means no input (timeout)
-                result = self.input_handler(key)
-                return result
+            if self._wakeup_r is not None and not self._input_ready:
+                return None
                 
+            for _ in range(self.max_keys_per_tick):
+                key = self.stdscr.getch()
+                # Keep reading until curses reports its buffer is empty
+                self._input_ready = key != -1
+                if key == -1:  # -1 means no input (timeout)
+                    break
+                    
+                if self.input_handler:
+                    result = self.input_handler(key)
+                    if result == "quit":
+                        return result
+                if self.shutdown_requested or self.resize_pending:
+                    break
+                    
         except curses.error:
             # Timeout or other curses error - not critical
             pass
@@ -256,7 +437,11 @@ class TUIEngine:
         return None
         
     def set_draw_handler(self, handler: Callable):
-        """Set the main drawing function"""
+        """Set the main drawing function
+        
+        The handler may return False to report an unchanged frame, which
+        skips the terminal flush for that iteration.
+        """
         self.draw_handler = handler
         
     def set_input_handler(self, handler: Callable):
@@ -271,6 +456,10 @@ class TUIEngine:
         """Set the error handling function"""
         self.error_handler = handler
         
+    def set_wait_handler(self, handler: Callable[[], Tuple[Optional[float], List[int]]]):
+        """Set the function returning (seconds until next scheduled work, fds to watch)"""
+        self.wait_handler = handler
+        
     def preserve_state(self, key: str, value: Any):
         """Preserve state that should survive resize/refresh"""
         self.preserved_state[key] = value
@@ -281,32 +470,41 @@ class TUIEngine:
         
     def get_color_pair(self, color_name: str) -> int:
         """Get color pair number for named color"""
-        color_map = {
-            'error': 1, 'red': 1,
-            'success': 2, 'green': 2,
-            'warning': 3, 'yellow': 3,
-            'info': 4, 'blue': 4,
-            'highlight': 5, 'cyan': 5,
-            'special': 6, 'magenta': 6
-        }
-        return curses.color_pair(color_map.get(color_name.lower(), 0))
+        pair = self._color_pairs.get(color_name)
+        if pair is None:
+            pair = self._resolve_color_pair(color_name)
+        return pair
+        
+    def _resolve_color_pair(self, color_name: str) -> int:
+        """Initialize the named pair on first use and cache its attribute"""
+        if not self.stdscr:
+            return 0
+        number = _COLOR_PAIR_NUMBERS.get(color_name.lower(), 0)
+        if number and self._colors_enabled:
+            try:
+                curses.init_pair(number, *_COLOR_PAIR_DEFS[number])
+            except curses.error as e:
+                self.logger.debug("init_pair %s failed: %s", number, e)
+        pair = curses.color_pair(number)
+        self._color_pairs[color_name] = pair
+        return pair
         
     def safe_addstr(self, y: int, x: int, text: str, attr: int = 0, max_width: Optional[int] = None):
         """Safely add string to screen with bounds checking"""
         try:
-            if not self.stdscr or not self.terminal_info:
+            if not self.stdscr:
                 return False
                 
-            # Check bounds
-            if y < 0 or y >= self.terminal_info.height:
-                return False
-            if x < 0 or x >= self.terminal_info.width:
+            # Check bounds (both are 0 until the terminal is detected)
+            h = self._h
+            w = self._w
+            if not (0 <= y < h and 0 <= x < w):
                 return False
                 
-            # Truncate text if necessary
-            available_width = self.terminal_info.width - x
-            if max_width:
-                available_width = min(available_width, max_width)
+            # Truncate text if necessary; text that fits is passed through as-is
+            available_width = w - x
+            if max_width and max_width < available_width:
+                available_width = max_width
                 
             if len(text) > available_width:
                 text = text[:available_width-1] + "…" if available_width > 0 else ""
@@ -334,6 +532,7 @@ class TUIEngine:
             signal.signal(signal.SIGWINCH, self._signal_handler)
             signal.signal(signal.SIGINT, self._signal_handler)
             signal.signal(signal.SIGTERM, self._signal_handler)
+            self._install_wakeup_fd()
             
             # Initialize curses
             self._initialize_curses()
@@ -353,6 +552,9 @@ class TUIEngine:
                     # Draw interface
                     self._safe_draw()
                     
+                    # Sleep until there is something to do
+                    self._wait_for_events()
+                    
                     # Handle input
                     input_result = self._safe_input()
                     
@@ -371,6 +573,8 @@ class TUIEngine:
                         self.error_handler(e)
                         
             # Check exit conditions
+            if self._shutdown_signal is not None:
+                self.logger.info("Shutdown signal %s received", self._shutdown_signal)
             if self.error_count >= self.max_errors:
                 self.logger.error(f"Too many errors ({self.error_count}), shutting down")
                 exit_code = 1
@@ -389,7 +593,8 @@ class TUIEngine:
         finally:
             self.state = TUIState.SHUTTING_DOWN
             self._cleanup_curses()
-            self.logger.info(f"TUI engine shutdown complete (exit code: {exit_code})")
+            self._remove_wakeup_fd()
+            self.logger.info("TUI engine shutdown complete (exit code: %s)", exit_code)
             
         return exit_code
 
@@ -424,6 +629,49 @@ def test_terminal_compatibility():
             'fallback_available': True
         }
 
+def _compatibility_cache_key() -> str:
+    """Key compatibility results on terminal type and terminfo database version"""
+    terminfo = os.environ.get('TERMINFO', '/usr/share/terminfo')
+    try:
+        terminfo_mtime = os.stat(terminfo).st_mtime_ns
+    except OSError:
+        terminfo_mtime = 0
+    return f"{os.environ.get('TERM', '')}:{terminfo_mtime}"
+
+def cached_terminal_compatibility() -> Dict[str, Any]:
+    """
+    test_terminal_compatibility() memoized on disk per terminal type.
+    
+    Only supported results are cached, so a failing terminal is re-probed
+    on every launch.
+    """
+    cache_dir = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                             'agent-manager')
+    cache_file = os.path.join(cache_dir, 'compat.json')
+    key = _compatibility_cache_key()
+    
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+        
+    result = cache.get(key)
+    if result and result.get('supported'):
+        return result
+        
+    result = test_terminal_compatibility()
+    if result['supported']:
+        cache[key] = result
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except OSError:
+            pass  # Caching is best effort
+            
+    return result
+
 if __name__ == "__main__":
     # Basic test of TUI engine
     def test_draw(stdscr, terminal_info):
@@ -13,17 +13,116 @@ Key features:
 
 import os
 import re
+import sys
 import time
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Tuple, Callable, Iterator
+from dataclasses import dataclass, field, asdict, replace
 from pathlib import Path
 import hashlib
-import glob
+import fnmatch
+import threading
+import bisect
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
-@dataclass
+# Format used for preformatted review item dates
+DISPLAY_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Slotted records where supported (3.10+): smaller instances, faster attribute access
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Patterns compiled once at import rather than looked up per call
+_RE_HANDOFF_FN = re.compile(r'handoff-(\d+)_(\d+)')
+_RE_HANDOFF_FIELDS = re.compile(
+    r'\*\*Description\*\*:\s*(?=(?P<desc>.+))'  # Lookahead: later fields may share the line
+    r'|\*\*Confidence\*\*:\s*(?P<conf>\w+)'
+    r'|\*\*Priority\*\*:\s*(?P<prio>\w+)'
+    r'|\*\*Handoff Reason\*\*:\s*(?P<reason>\w+)'
+)
+_RE_ITEM_CONFIDENCE = re.compile(r'\*\*Confidence\*\*:\s*(\S+)')
+_RE_ITEM_TYPE = re.compile(r'\*\*Type\*\*:\s*(\w+)')
+_RE_ITEM_ADDED = re.compile(r'\*\*Added\*\*:\s*(.+)')
+_RE_ITEM_DEADLINE = re.compile(r'\*\*Deadline\*\*:\s*(.+)')
+_RE_ITEM_FILES = re.compile(r'\*\*Files\*\*:\s*(.+)')
+_RE_SPRINT_TITLE = re.compile(r'# Sprint #(\d+): (.+?) - (.+?) to (.+)')
+_RE_AGENT_FILE = re.compile(r'- \*\*Agent (\d+)\*\*: `([^`]+)`')
+_RE_SPRINT_HEALTH = re.compile(r'## 📊 Sprint Health: (.+)')
+_RE_COMPLETION = re.compile(r'\*\*Completed\*\*: (\d+)/(\d+) tasks \((\d+)%\)')
+
+_O_READ = os.O_RDONLY | getattr(os, 'O_BINARY', 0)  # O_BINARY: no newline translation on Windows
+HANDOFF_HEAD_BYTES = 8192  # Leading bytes of a handoff file read before the rest
+
+def _read_to_eof(fd: int, data: bytes) -> bytes:
+    """data followed by everything left to read from fd"""
+    chunks = [data]
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y%m%d_%H%M%S",
+    "%a %b %d %H:%M:%S %Z %Y"
+)
+
+def _section(content: str, marker: str) -> Optional[str]:
+    """Text after the first marker up to the next '##', or None if the marker is absent"""
+    i = content.find(marker)
+    if i < 0:
+        return None
+    i += len(marker)
+    j = content.find('##', i)
+    return content[i:j] if j >= 0 else content[i:]
+
+_ITEM_HEAD = '- **['
+_ITEM_HEAD_END = ']** - '
+_ITEM_TERMINATORS = ('\n  -', '\n\n', '\n- **')
+
+def _iter_review_items(content: str) -> Iterator[Tuple[str, str]]:
+    """Yield (agent_id, block) for each '- **[agent]** - ...' item.
+    
+    The block runs to the first sub-item, blank line or next item. Plain
+    find() calls do the scan; the next hit of each terminator is kept and
+    only searched again once the scan has passed it, so the whole section
+    is walked once.
+    """
+    end = len(content)
+    next_stop = [-1] * len(_ITEM_TERMINATORS)
+    pos = content.find(_ITEM_HEAD)
+    while pos >= 0:
+        id_start = pos + len(_ITEM_HEAD)
+        id_end = content.find(']', id_start)
+        if id_end <= id_start or not content.startswith(_ITEM_HEAD_END, id_end):
+            pos = content.find(_ITEM_HEAD, pos + 1)
+            continue
+        block_start = id_end + len(_ITEM_HEAD_END)
+        if block_start >= end:
+            return
+            
+        # The block holds at least one character before any terminator
+        block_end = end
+        for i, terminator in enumerate(_ITEM_TERMINATORS):
+            stop = next_stop[i]
+            if stop <= block_start and stop != end:
+                stop = content.find(terminator, block_start + 1)
+                if stop < 0:
+                    stop = end
+                next_stop[i] = stop
+            if stop < block_end:
+                block_end = stop
+                
+        yield content[id_start:id_end], content[block_start:block_end]
+        pos = content.find(_ITEM_HEAD, block_end)
+
+@dataclass(**_DATACLASS_SLOTS)
 class AgentInfo:
     """Structured agent information"""
     agent_id: str
@@ -31,18 +130,17 @@ class AgentInfo:
     confidence: str = "medium"  # high, medium, low
     current_task: str = "No active task"
     last_update: Optional[datetime] = None
-    files_owned: List[str] = None
-    blockers: List[str] = None
+    files_owned: List[str] = field(default_factory=list)
+    blockers: List[str] = field(default_factory=list)
     handoff_file: Optional[str] = None
     priority: str = "medium"
+    last_update_epoch: Optional[float] = None  # last_update as POSIX seconds
     
     def __post_init__(self):
-        if self.files_owned is None:
-            self.files_owned = []
-        if self.blockers is None:
-            self.blockers = []
+        if self.last_update_epoch is None and self.last_update is not None:
+            self.last_update_epoch = self.last_update.timestamp()
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ReviewItem:
     """Structured review queue item"""
     agent_id: str
@@ -51,26 +149,39 @@ class ReviewItem:
     timestamp: Optional[datetime] = None
     confidence: str = "medium"
     item_type: str = "unknown"  # feature, improvement, optimization, etc.
-    files: List[str] = None
-    blockers: List[str] = None
+    files: List[str] = field(default_factory=list)
+    blockers: List[str] = field(default_factory=list)
     deadline: Optional[datetime] = None
+    timestamp_display: Optional[str] = None  # timestamp/deadline formatted once at parse time
+    deadline_display: Optional[str] = None
     
     def __post_init__(self):
-        if self.files is None:
-            self.files = []
-        if self.blockers is None:
-            self.blockers = []
         if self.timestamp is None:
             self.timestamp = datetime.now()
+        self.format_dates()
+        
+    def format_dates(self):
+        """Refresh the display strings after timestamp/deadline change"""
+        self.timestamp_display = self.timestamp.strftime(DISPLAY_DATETIME_FORMAT) if self.timestamp else None
+        self.deadline_display = self.deadline.strftime(DISPLAY_DATETIME_FORMAT) if self.deadline else None
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProjectState:
     """Overall project state information"""
     agents: Dict[str, AgentInfo]
     review_items: List[ReviewItem]
     last_refresh: datetime
     sprint_info: Dict[str, Any]
-    file_hashes: Dict[str, str]  # For change detection
+    file_stamps: Dict[str, Tuple[int, int]]  # (st_size, st_mtime_ns) per source file, for change detection
+    status_counts: Counter = field(default_factory=Counter)  # Agents per status
+    priority_counts: Counter = field(default_factory=Counter)  # Review items per priority
+    agents_by_status: Dict[str, List[AgentInfo]] = field(default_factory=dict)
+    items_by_priority: Dict[str, List[ReviewItem]] = field(default_factory=dict)
+    agents_by_update: List[AgentInfo] = field(default_factory=list)  # Agents with last_update, oldest first
+    update_times: List[datetime] = field(default_factory=list)  # last_update of agents_by_update, for bisect
+    agents_version: int = 0  # Bumped only when agent contents change
+    review_version: int = 0  # Bumped only when review items change
+    last_refresh_display: Optional[str] = None  # last_refresh as HH:MM:SS, formatted once per parse
     
     def __post_init__(self):
         if not self.agents:
@@ -79,8 +190,10 @@ class ProjectState:
             self.review_items = []
         if not self.sprint_info:
             self.sprint_info = {}
-        if not self.file_hashes:
-            self.file_hashes = {}
+        if not self.file_stamps:
+            self.file_stamps = {}
+        if self.last_refresh_display is None:
+            self.last_refresh_display = self.last_refresh.strftime('%H:%M:%S')
 
 class FileParseError(Exception):
     """Custom exception for file parsing errors"""
@@ -106,16 +219,31 @@ class FileParser:
         
         # File patterns
         self.handoff_pattern = "handoff-*.md"
+        self._handoff_re = re.compile(fnmatch.translate(self.handoff_pattern))
         self.review_file = "docs/sprints/human-review.md"
         self.sprint_file = "docs/sprints/current-sprint.md"
         
+        # Parsed results per source file, keyed by path -> (stamp, result)
+        self._parse_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self.read_count = 0  # File reads during the latest parse
+        self._stats_lock = threading.Lock()  # Handoff files are parsed on worker threads
+        self._last_datetime_format: Optional[str] = None  # Format that matched most recently
+        
+        # Content signatures behind ProjectState.agents_version/review_version
+        self._agents_signature: Optional[int] = None
+        self._review_signature: Optional[int] = None
+        self._agents_version = 0
+        self._review_version = 0
+        
         # Parsing statistics
         self.parse_stats = {
             'handoff_files_parsed': 0,
             'handoff_files_errors': 0,
             'review_items_parsed': 0,
             'cache_hits': 0,
-            'cache_misses': 0
+            'cache_misses': 0,
+            'files_read': 0,
+            'file_cache_hits': 0
         }
         
     def _setup_logging(self) -> logging.Logger:
@@ -131,33 +259,84 @@ class FileParser:
         return logger
         
     def _calculate_file_hash(self, filepath: str) -> str:
-        """Calculate hash of file for change detection"""
+        """Calculate hash of file contents (for callers that need content equality)"""
         try:
-            with open(filepath, 'rb') as f:
-                return hashlib.md5(f.read()).hexdigest()
+            with open(filepath, 'rb', buffering=0) as f:
+                if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                    return hashlib.file_digest(f, 'md5').hexdigest()
+                digest = hashlib.md5()
+                for chunk in iter(lambda: f.read(65536), b''):
+                    digest.update(chunk)
+                return digest.hexdigest()
         except Exception:
             return ""
             
-    def _has_file_changed(self, filepath: str, cached_hash: str) -> bool:
+    def _read_file(self, filepath: str) -> str:
+        """Read a source file as text"""
+        # Raw descriptor: one fstat sizes a single read(size + 1) that both
+        # returns the file and, by coming up short, confirms EOF. A file
+        # object would add its own fstat/lseek and a second read for EOF
+        fd = os.open(filepath, _O_READ)
+        try:
+            size = os.fstat(fd).st_size
+            data = os.read(fd, size + 1)
+            if len(data) > size:
+                # Grew since the fstat; read on to EOF
+                data = _read_to_eof(fd, data)
+        finally:
+            os.close(fd)
+            
+        return self._decode(data)
+        
+    def _decode(self, data: bytes, count: bool = True) -> str:
+        """Decode file bytes, counting the read unless it continues an earlier one"""
+        if count:
+            with self._stats_lock:
+                self.read_count += 1
+                self.parse_stats['files_read'] += 1
+        
+        content = data.decode('utf-8')
+        if '\r' in content:
+            # Same universal newline handling as text mode
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+        
+    def _parse_cached(self, filepath: str, stamp: Tuple[int, int], parse_func: Callable[[str], Any]) -> Any:
+        """Run parse_func on filepath unless it is unchanged since the last parse"""
+        cached = self._parse_cache.get(filepath)
+        if cached is not None and cached[0] == stamp:
+            self.parse_stats['file_cache_hits'] += 1
+            return cached[1]
+            
+        result = parse_func(filepath)
+        self._parse_cache[filepath] = (stamp, result)
+        return result
+        
+    def _has_file_changed(self, filepath: str, cached_stamp: Tuple[int, int]) -> bool:
         """Check if file has changed since last parse"""
-        current_hash = self._calculate_file_hash(filepath)
-        return current_hash != cached_hash
+        return self._file_stamp(filepath) != cached_stamp
         
     def _parse_datetime(self, date_str: str) -> Optional[datetime]:
         """Parse datetime from various string formats"""
-        formats = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y%m%d_%H%M%S",
-            "%a %b %d %H:%M:%S %Z %Y"
-        ]
-        
-        for fmt in formats:
+        date_str = date_str.strip()
+        
+        # Files use one format consistently, so try the last one that matched first
+        last_fmt = self._last_datetime_format
+        if last_fmt is not None:
             try:
-                return datetime.strptime(date_str.strip(), fmt)
+                return datetime.strptime(date_str, last_fmt)
             except ValueError:
+                pass
+        
+        for fmt in _DATETIME_FORMATS:
+            if fmt == last_fmt:
                 continue
+            try:
+                result = datetime.strptime(date_str, fmt)
+            except ValueError:
+                continue
+            self._last_datetime_format = fmt
+            return result
                 
         self.logger.warning(f"Could not parse datetime: {date_str}")
         return None
@@ -165,7 +344,7 @@ class FileParser:
     def _extract_agent_from_filename(self, filename: str) -> str:
         """Extract agent ID from handoff filename"""
         # Try to extract from handoff filename pattern
-        match = re.search(r'handoff-(\d+)_(\d+)', filename)
+        match = _RE_HANDOFF_FN.search(filename)
         if match:
             return f"handoff-{match.group(1)}_{match.group(2)}"
             
@@ -175,88 +354,130 @@ class FileParser:
     def _parse_handoff_file(self, filepath: str) -> Optional[AgentInfo]:
         """Parse a handoff file and extract agent information"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
             # Extract agent ID
             agent_id = self._extract_agent_from_filename(filepath)
             
-            # Initialize agent info
-            agent = AgentInfo(agent_id=agent_id, handoff_file=filepath)
-            
-            # Extract task description
-            task_match = re.search(r'\*\*Description\*\*:\s*(.+)', content)
-            if task_match:
-                agent.current_task = task_match.group(1).strip()
-            else:
-                # Try alternative formats
-                summary_match = re.search(r'## 📋 Task Summary\n\*\*Description\*\*:\s*(.+)', content)
-                if summary_match:
-                    agent.current_task = summary_match.group(1).strip()
-                else:
-                    # Extract from title or first meaningful line
-                    lines = content.split('\n')
-                    for line in lines[1:10]:  # Check first 10 lines
-                        if line.strip() and not line.startswith('#') and not line.startswith('**'):
-                            agent.current_task = line.strip()[:100]  # Limit length
-                            break
-                            
-            # Extract confidence level
-            confidence_match = re.search(r'\*\*Confidence\*\*:\s*(\w+)', content)
-            if confidence_match:
-                agent.confidence = confidence_match.group(1).lower()
-                
-            # Extract priority
-            priority_match = re.search(r'\*\*Priority\*\*:\s*(\w+)', content)
-            if priority_match:
-                agent.priority = priority_match.group(1).lower()
-                
-            # Extract handoff reason to determine status
-            reason_match = re.search(r'\*\*Handoff Reason\*\*:\s*(\w+)', content)
-            if reason_match:
-                reason = reason_match.group(1).lower()
-                if reason in ['blocked', 'blocking']:
-                    agent.status = "blocked"
-                elif reason in ['completed', 'done', 'finished']:
-                    agent.status = "completed"
-                else:
-                    agent.status = "active"
-                    
-            # Extract blockers
-            if "## 🚨 Blockers" in content:
-                blocker_section = content.split("## 🚨 Blockers")[1].split("##")[0]
-                agent.blockers = [
-                    line.strip().lstrip('- ').strip() 
-                    for line in blocker_section.split('\n') 
-                    if line.strip() and line.strip().startswith(('-', '*'))
-                ]
-                if agent.blockers:
-                    agent.status = "blocked"
+            # Metadata sits at the top of a handoff; only read the rest of the
+            # file when something was not settled within the head
+            fd = os.open(filepath, _O_READ)
+            try:
+                head = os.read(fd, HANDOFF_HEAD_BYTES)
+                complete = len(head) < HANDOFF_HEAD_BYTES
+                # Cut back to whole lines; a newline byte never occurs inside
+                # a multi-byte UTF-8 sequence
+                content = self._decode(head if complete else head[:head.rfind(b'\n') + 1])
+                agent = AgentInfo(agent_id=agent_id, handoff_file=filepath)
+                if not self._extract_handoff_metadata(agent, content, complete):
+                    # Continue from the head's offset: the same read, not a second one
+                    content = self._decode(_read_to_eof(fd, head), count=False)
+                    agent = AgentInfo(agent_id=agent_id, handoff_file=filepath)
+                    self._extract_handoff_metadata(agent, content, True)
+            finally:
+                os.close(fd)
                     
             # Extract file modification time as last update
             try:
                 mtime = os.path.getmtime(filepath)
                 agent.last_update = datetime.fromtimestamp(mtime)
+                agent.last_update_epoch = mtime
             except Exception:
                 agent.last_update = datetime.now()
+                agent.last_update_epoch = agent.last_update.timestamp()
                 
-            self.parse_stats['handoff_files_parsed'] += 1
+            with self._stats_lock:
+                self.parse_stats['handoff_files_parsed'] += 1
             self.logger.debug(f"Parsed handoff file: {filepath} -> {agent.agent_id}")
             
             return agent
             
         except Exception as e:
-            self.parse_stats['handoff_files_errors'] += 1
+            with self._stats_lock:
+                self.parse_stats['handoff_files_errors'] += 1
             self.logger.error(f"Error parsing handoff file {filepath}: {e}")
             return None
             
+    def _extract_handoff_metadata(self, agent: AgentInfo, content: str, complete: bool) -> bool:
+        """Fill agent fields from handoff text.
+        
+        Returns False when content is only the head of the file and the
+        rest could still change the result.
+        """
+        # Extract description, confidence, priority and handoff reason in
+        # one scan; the first occurrence of each field wins
+        seen = set()
+        ends = []
+        for match in _RE_HANDOFF_FIELDS.finditer(content):
+            name = match.lastgroup
+            if name in seen:
+                continue
+            seen.add(name)
+            ends.append(match.end(name))
+            
+            value = match.group(name)
+            if name == "desc":
+                agent.current_task = value.strip()
+            elif name == "conf":
+                agent.confidence = value.lower()
+            elif name == "prio":
+                agent.priority = value.lower()
+            else:
+                # Handoff reason determines status
+                reason = value.lower()
+                if reason in ['blocked', 'blocking']:
+                    agent.status = "blocked"
+                elif reason in ['completed', 'done', 'finished']:
+                    agent.status = "completed"
+                else:
+                    agent.status = "active"
+                    
+            if len(seen) == 4:
+                break
+                
+        if "desc" not in seen:
+            # Extract from title or first meaningful line. Walk the first 10
+            # lines by offset; split() would copy the rest of the file too
+            start = content.find('\n') + 1
+            for _ in range(9):
+                if not start:
+                    break
+                end = content.find('\n', start)
+                line = content[start:end] if end >= 0 else content[start:]
+                if line.strip() and not line.startswith('#') and not line.startswith('**'):
+                    agent.current_task = line.strip()[:100]  # Limit length
+                    break
+                start = end + 1
+                    
+        # Extract blockers
+        marker = "## 🚨 Blockers"
+        blocker_section = _section(content, marker)
+        if blocker_section is not None:
+            agent.blockers = [
+                line.strip().lstrip('- ').strip() 
+                for line in blocker_section.split('\n') 
+                if line.strip() and line.strip().startswith(('-', '*'))
+            ]
+            if agent.blockers:
+                agent.status = "blocked"
+                
+        if complete:
+            return True
+            
+        # A head settles the result only if every field matched clear of its
+        # trailing whitespace and the blockers section ended inside it
+        if len(ends) < 4 or max(ends) >= len(content.rstrip()):
+            return False
+        return blocker_section is not None and content.find('##', content.find(marker) + len(marker)) >= 0
+        
     def _parse_review_file(self, filepath: str) -> List[ReviewItem]:
         """Parse the human review queue file"""
         review_items = []
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_file(filepath)
+            
+            # Items without an Added line are stamped with the parse time;
+            # take it once for the whole file
+            now = datetime.now()
                 
             # Parse each priority section
             sections = {
@@ -266,17 +487,14 @@ class FileParser:
             }
             
             for priority, (start_marker, end_marker) in sections.items():
-                if start_marker in content:
+                start_idx = content.find(start_marker)
+                if start_idx >= 0:
                     # Extract section content
-                    start_idx = content.find(start_marker)
-                    if end_marker in content[start_idx:]:
-                        end_idx = content.find(end_marker, start_idx)
-                        section_content = content[start_idx:end_idx]
-                    else:
-                        section_content = content[start_idx:]
+                    end_idx = content.find(end_marker, start_idx)
+                    section_content = content[start_idx:end_idx] if end_idx >= 0 else content[start_idx:]
                         
                     # Parse items in this section
-                    items = self._parse_review_section(section_content, priority)
+                    items = self._parse_review_section(section_content, priority, now)
                     review_items.extend(items)
                     
             self.logger.debug(f"Parsed {len(review_items)} review items from {filepath}")
@@ -286,19 +504,19 @@ class FileParser:
             
         return review_items
         
-    def _parse_review_section(self, section_content: str, priority: str) -> List[ReviewItem]:
+    def _parse_review_section(self, section_content: str, priority: str,
+                              now: Optional[datetime] = None) -> List[ReviewItem]:
         """Parse a specific priority section of the review file"""
         items = []
         
-        # Pattern to match review items
-        item_pattern = r'- \*\*\[([^\]]+)\]\*\* - (.+?)(?=\n  -|\n\n|\n- \*\*|\Z)'
-        
-        matches = re.finditer(item_pattern, section_content, re.DOTALL)
-        
-        for match in matches:
+        # Empty sections never reach the regex engine
+        if '- **[' not in section_content:
+            return items
+            
+        for agent_id, description_block in _iter_review_items(section_content):
             try:
-                agent_id = match.group(1).strip()
-                description_block = match.group(2).strip()
+                agent_id = agent_id.strip()
+                description_block = description_block.strip()
                 
                 # Extract main description (first line)
                 description_lines = description_block.split('\n')
@@ -312,7 +530,8 @@ class FileParser:
                 item = ReviewItem(
                     agent_id=agent_id,
                     description=description,
-                    priority=priority
+                    priority=priority,
+                    timestamp=now
                 )
                 
                 # Parse additional details from the block
@@ -321,38 +540,39 @@ class FileParser:
                     if line.startswith('- **'):
                         # Parse structured fields
                         if '**Confidence**:' in line:
-                            conf_match = re.search(r'\*\*Confidence\*\*:\s*(\S+)', line)
+                            conf_match = _RE_ITEM_CONFIDENCE.search(line)
                             if conf_match:
                                 item.confidence = conf_match.group(1).strip()
                                 
                         elif '**Type**:' in line:
-                            type_match = re.search(r'\*\*Type\*\*:\s*(\w+)', line)
+                            type_match = _RE_ITEM_TYPE.search(line)
                             if type_match:
                                 item.item_type = type_match.group(1).strip()
                                 
                         elif '**Added**:' in line:
-                            date_match = re.search(r'\*\*Added\*\*:\s*(.+)', line)
+                            date_match = _RE_ITEM_ADDED.search(line)
                             if date_match:
                                 item.timestamp = self._parse_datetime(date_match.group(1))
                                 
                         elif '**Deadline**:' in line:
-                            deadline_match = re.search(r'\*\*Deadline\*\*:\s*(.+)', line)
+                            deadline_match = _RE_ITEM_DEADLINE.search(line)
                             if deadline_match:
                                 item.deadline = self._parse_datetime(deadline_match.group(1))
                                 
                         elif '**Files**:' in line:
-                            files_match = re.search(r'\*\*Files\*\*:\s*(.+)', line)
+                            files_match = _RE_ITEM_FILES.search(line)
                             if files_match:
                                 files_str = files_match.group(1)
                                 item.files = [f.strip() for f in files_str.split(',') if f.strip()]
                                 
+                item.format_dates()
                 items.append(item)
-                self.parse_stats['review_items_parsed'] += 1
                 
             except Exception as e:
                 self.logger.warning(f"Error parsing review item: {e}")
                 continue
                 
+        self.parse_stats['review_items_parsed'] += len(items)
         return items
         
     def _parse_sprint_file(self, filepath: str) -> Dict[str, Any]:
@@ -360,11 +580,10 @@ class FileParser:
         sprint_info = {}
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_file(filepath)
                 
             # Extract sprint metadata
-            title_match = re.search(r'# Sprint #(\d+): (.+?) - (.+?) to (.+)', content)
+            title_match = _RE_SPRINT_TITLE.search(content)
             if title_match:
                 sprint_info.update({
                     'sprint_number': int(title_match.group(1)),
@@ -374,12 +593,12 @@ class FileParser:
                 })
                 
             # Extract agent file ownership
-            if "## 🗂️ File Ownership" in content:
-                ownership_section = content.split("## 🗂️ File Ownership")[1].split("##")[0]
+            ownership_section = _section(content, "## 🗂️ File Ownership")
+            if ownership_section is not None:
                 agents_files = {}
                 
                 for line in ownership_section.split('\n'):
-                    match = re.search(r'- \*\*Agent (\d+)\*\*: `([^`]+)`', line)
+                    match = _RE_AGENT_FILE.search(line)
                     if match:
                         agent_id = f"agent-{match.group(1)}"
                         files = [f.strip() for f in match.group(2).split(',')]
@@ -388,12 +607,12 @@ class FileParser:
                 sprint_info['agent_files'] = agents_files
                 
             # Extract sprint health
-            health_match = re.search(r'## 📊 Sprint Health: (.+)', content)
+            health_match = _RE_SPRINT_HEALTH.search(content)
             if health_match:
                 sprint_info['health'] = health_match.group(1).strip()
                 
             # Extract completion percentage
-            completion_match = re.search(r'\*\*Completed\*\*: (\d+)/(\d+) tasks \((\d+)%\)', content)
+            completion_match = _RE_COMPLETION.search(content)
             if completion_match:
                 sprint_info.update({
                     'completed_tasks': int(completion_match.group(1)),
@@ -406,17 +625,51 @@ class FileParser:
             
         return sprint_info
         
-    def _discover_handoff_files(self) -> List[str]:
-        """Discover all handoff files in the current directory"""
+    def _discover_handoff_files(self) -> List[Tuple[str, Tuple[int, int]]]:
+        """
+        Discover all handoff files in the current directory.
+        
+        Returns (path, (st_size, st_mtime_ns)) pairs, newest first, from a
+        single os.scandir pass.
+        """
+        handoff_files = []
+        
         try:
-            # Get all handoff files, sorted by modification time (newest first)
-            handoff_files = glob.glob(self.handoff_pattern)
-            handoff_files.sort(key=os.path.getmtime, reverse=True)
-            return handoff_files
-        except Exception as e:
+            with os.scandir('.') as entries:
+                for entry in entries:
+                    if self._handoff_re.match(entry.name) and entry.is_file():
+                        st = entry.stat()
+                        handoff_files.append((entry.name, (st.st_size, st.st_mtime_ns)))
+        except OSError as e:
             self.logger.error(f"Error discovering handoff files: {e}")
-            return []
             
+        handoff_files.sort(key=lambda handoff: handoff[1][1], reverse=True)
+        return handoff_files
+        
+    def _file_stamp(self, filepath: str) -> Optional[Tuple[int, int]]:
+        """(st_size, st_mtime_ns) of filepath from one stat, or None if it does not exist"""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
+        
+    def get_file_stamps(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Get (st_size, st_mtime_ns) stamps for all source files.
+        
+        Cheap enough to poll every tick: one directory scan plus a stat per
+        fixed file, no file contents are read.
+        """
+        stamps = dict(self._discover_handoff_files())
+            
+        for filepath in (self.review_file, self.sprint_file):
+            stamp = self._file_stamp(filepath)
+            if stamp is not None:  # Optional file
+                stamps[filepath] = stamp
+                
+        return stamps
+        
     def _should_refresh_cache(self) -> bool:
         """Check if cache should be refreshed"""
         if not self.cached_data:
@@ -426,12 +679,11 @@ class FileParser:
         if datetime.now() - self.cached_data.last_refresh > self.cache_timeout:
             return True
             
-        # Check if any tracked files have changed
-        for filepath, cached_hash in self.cached_data.file_hashes.items():
-            if os.path.exists(filepath) and self._has_file_changed(filepath, cached_hash):
-                self.logger.debug(f"File changed: {filepath}")
-                return True
-                
+        # Any source file added, removed or changed (stats only, no reads)
+        if self.get_file_stamps() != self.cached_data.file_stamps:
+            self.logger.debug("Source files changed")
+            return True
+            
         return False
         
     def parse_project_state(self, force_refresh: bool = False) -> ProjectState:
@@ -459,34 +711,80 @@ class FileParser:
             review_items=[],
             last_refresh=datetime.now(),
             sprint_info={},
-            file_hashes={}
+            file_stamps={}
         )
         
-        # Parse handoff files
-        handoff_files = self._discover_handoff_files()
-        for handoff_file in handoff_files:
-            agent_info = self._parse_handoff_file(handoff_file)
+        # Each file is read at most once per parse, and not at all if unchanged
+        self.read_count = 0
+        
+        # Merged agents from the previous state are reused as-is when neither
+        # their handoff file nor the sprint file (which feeds files_owned) changed
+        sprint_stamp = self._file_stamp(self.sprint_file)
+        previous = self.cached_data
+        if previous is not None and previous.file_stamps.get(self.sprint_file) != sprint_stamp:
+            previous = None
+            
+        # Parse handoff files. The agent ID comes from the filename alone, so
+        # files superseded by a newer handoff for the same agent are skipped
+        # without being read
+        handoff_files = [(handoff_file, stamp, self._extract_agent_from_filename(handoff_file))
+                         for handoff_file, stamp in self._discover_handoff_files()]
+        
+        # Reads are I/O bound; parse the stale subset concurrently
+        claimed = set()
+        stale = []
+        for handoff_file, stamp, agent_id in handoff_files:
+            if agent_id in claimed:
+                continue
+            claimed.add(agent_id)
+            if self._parse_cache.get(handoff_file, (None,))[0] != stamp:
+                stale.append(handoff_file)
+        prefetched = {}
+        if len(stale) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(stale))) as pool:
+                prefetched = dict(zip(stale, pool.map(self._parse_handoff_file, stale)))
+                
+        for handoff_file, stamp, agent_id in handoff_files:
+            project_state.file_stamps[handoff_file] = stamp
+            # Only keep the most recent handoff per agent; an older one is
+            # parsed only if every newer one failed to parse
+            if agent_id in project_state.agents:
+                continue
+            if handoff_file in prefetched:
+                agent_info = prefetched[handoff_file]
+                self._parse_cache[handoff_file] = (stamp, agent_info)
+            else:
+                agent_info = self._parse_cached(handoff_file, stamp, self._parse_handoff_file)
             if agent_info:
-                # Only keep the most recent handoff per agent
-                if agent_info.agent_id not in project_state.agents:
-                    project_state.agents[agent_info.agent_id] = agent_info
-                    project_state.file_hashes[handoff_file] = self._calculate_file_hash(handoff_file)
-                    
+                kept = previous.agents.get(agent_id) if previous else None
+                if (kept is None or kept.handoff_file != handoff_file
+                        or previous.file_stamps.get(handoff_file) != stamp):
+                    # Copy: the sprint merge below mutates agents
+                    kept = replace(agent_info)
+                project_state.agents[agent_id] = kept
+                
         # Parse review queue
-        if os.path.exists(self.review_file):
-            project_state.review_items = self._parse_review_file(self.review_file)
-            project_state.file_hashes[self.review_file] = self._calculate_file_hash(self.review_file)
+        review_stamp = self._file_stamp(self.review_file)
+        if review_stamp is not None:
+            project_state.review_items = list(
+                self._parse_cached(self.review_file, review_stamp, self._parse_review_file))
+            project_state.file_stamps[self.review_file] = review_stamp
             
         # Parse sprint information
-        if os.path.exists(self.sprint_file):
-            project_state.sprint_info = self._parse_sprint_file(self.sprint_file)
-            project_state.file_hashes[self.sprint_file] = self._calculate_file_hash(self.sprint_file)
+        if sprint_stamp is not None:
+            project_state.sprint_info = dict(
+                self._parse_cached(self.sprint_file, sprint_stamp, self._parse_sprint_file))
+            project_state.file_stamps[self.sprint_file] = sprint_stamp
             
             # Merge sprint agent assignments with handoff data
             if 'agent_files' in project_state.sprint_info:
                 for agent_id, files in project_state.sprint_info['agent_files'].items():
                     if agent_id not in project_state.agents:
                         # Create agent entry for sprint-assigned agents without handoffs
+                        kept = previous.agents.get(agent_id) if previous else None
+                        if kept is not None and kept.handoff_file is None:
+                            project_state.agents[agent_id] = kept
+                            continue
                         project_state.agents[agent_id] = AgentInfo(
                             agent_id=agent_id,
                             status="idle",
@@ -497,6 +795,16 @@ class FileParser:
                         # Update existing agent with file ownership
                         project_state.agents[agent_id].files_owned = files
                         
+        # Aggregate and index once per parse rather than once per frame
+        self._index_state(project_state)
+                        
+        source_count = len(project_state.file_stamps)
+        if self.read_count > source_count:
+            self.logger.warning(f"Read {self.read_count} files for {source_count} sources")
+            
+        # Version the collections so consumers can skip unchanged data
+        self._update_versions(project_state)
+        
         # Cache the result
         self.cached_data = project_state
         
@@ -505,6 +813,50 @@ class FileParser:
         
         return project_state
         
+    def _index_state(self, project_state: ProjectState):
+        """Fill the per-status/per-priority indexes and counts and the update-time order"""
+        by_status: Dict[str, List[AgentInfo]] = {}
+        for agent in project_state.agents.values():
+            by_status.setdefault(agent.status, []).append(agent)
+        by_priority: Dict[str, List[ReviewItem]] = {}
+        for item in project_state.review_items:
+            by_priority.setdefault(item.priority, []).append(item)
+            
+        project_state.agents_by_status = by_status
+        project_state.items_by_priority = by_priority
+        project_state.status_counts = Counter({status: len(agents) for status, agents in by_status.items()})
+        project_state.priority_counts = Counter({priority: len(items) for priority, items in by_priority.items()})
+        
+        updated = sorted(
+            (agent for agent in project_state.agents.values() if agent.last_update),
+            key=lambda agent: agent.last_update
+        )
+        project_state.agents_by_update = updated
+        project_state.update_times = [agent.last_update for agent in updated]
+        
+    def _update_versions(self, project_state: ProjectState):
+        """Stamp agents/review versions, bumping them only on content change"""
+        agents_signature = hash(tuple(
+            (agent.agent_id, agent.status, agent.confidence, agent.priority, agent.current_task,
+             agent.last_update_epoch, tuple(agent.files_owned), tuple(agent.blockers))
+            for agent in project_state.agents.values()
+        ))
+        if agents_signature != self._agents_signature:
+            self._agents_signature = agents_signature
+            self._agents_version += 1
+            
+        review_signature = hash(tuple(
+            (item.agent_id, item.priority, item.description, item.confidence, item.item_type,
+             item.timestamp_display, item.deadline_display, tuple(item.files), tuple(item.blockers))
+            for item in project_state.review_items
+        ))
+        if review_signature != self._review_signature:
+            self._review_signature = review_signature
+            self._review_version += 1
+            
+        project_state.agents_version = self._agents_version
+        project_state.review_version = self._review_version
+        
     def get_agent_by_id(self, agent_id: str) -> Optional[AgentInfo]:
         """Get specific agent information"""
         project_state = self.parse_project_state()
@@ -513,22 +865,21 @@ class FileParser:
     def get_agents_by_status(self, status: str) -> List[AgentInfo]:
         """Get all agents with specific status"""
         project_state = self.parse_project_state()
-        return [agent for agent in project_state.agents.values() if agent.status == status]
+        return list(project_state.agents_by_status.get(status, ()))
         
     def get_review_items_by_priority(self, priority: str) -> List[ReviewItem]:
         """Get review items by priority level"""
         project_state = self.parse_project_state()
-        return [item for item in project_state.review_items if item.priority == priority]
+        return list(project_state.items_by_priority.get(priority, ()))
         
     def get_stale_agents(self, hours: int = 2) -> List[AgentInfo]:
-        """Get agents with no activity for specified hours"""
+        """Get agents with no activity for specified hours, oldest first"""
         cutoff = datetime.now() - timedelta(hours=hours)
         project_state = self.parse_project_state()
         
-        return [
-            agent for agent in project_state.agents.values()
-            if agent.last_update and agent.last_update < cutoff
-        ]
+        # Oldest first: everything before the cutoff's insertion point is stale
+        stale_count = bisect.bisect_left(project_state.update_times, cutoff)
+        return project_state.agents_by_update[:stale_count]
         
     def get_parse_statistics(self) -> Dict[str, Any]:
         """Get parsing statistics for monitoring"""
@@ -558,16 +909,16 @@ def get_current_project_state() -> ProjectState:
 def monitor_file_changes(callback: callable, interval: int = 5):
     """Monitor files for changes and call callback when updated"""
     parser = FileParser()
-    last_hashes = {}
+    last_stamps = None
     
     while True:
         try:
-            current_state = parser.parse_project_state()
-            
-            # Check for changes
-            if current_state.file_hashes != last_hashes:
+            # Ticks are stat-only; parse (just the changed files) on a change
+            stamps = parser.get_file_stamps()
+            if stamps != last_stamps:
+                current_state = parser.parse_project_state(force_refresh=True)
                 callback(current_state)
-                last_hashes = current_state.file_hashes.copy()
+                last_stamps = current_state.file_stamps
                 
             time.sleep(interval)
             
@@ -4,25 +4,21 @@ Visual mockup of TUI interface
 Shows what the interface would look like in a terminal
 """
 
+from functools import lru_cache
+
 def create_border(width, height, title=""):
     """Create a bordered box with optional title"""
-    lines = []
-    
     # Top border
     if title:
-        title_line = f"┌─ {title} " + "─" * (width - len(title) - 5) + "┐"
+        top = f"┌─ {title} {'─' * (width - len(title) - 5)}┐"
     else:
-        title_line = "┌" + "─" * (width - 2) + "┐"
-    lines.append(title_line)
-    
-    # Middle lines
-    for _ in range(height - 2):
-        lines.append("│" + " " * (width - 2) + "│")
+        top = f"┌{'─' * (width - 2)}┐"
     
-    # Bottom border
-    lines.append("└" + "─" * (width - 2) + "┘")
+    # Middle lines are identical, so one string is shared by every row
+    middle = f"│{' ' * (width - 2)}│"
+    bottom = f"└{'─' * (width - 2)}┘"
     
-    return lines
+    return [top] + [middle] * (height - 2) + [bottom]
 
 def place_text(lines, y, x, text, max_width=None):
     """Place text in the box at specific coordinates"""
@@ -33,8 +29,9 @@ def place_text(lines, y, x, text, max_width=None):
         line = lines[y]
         lines[y] = line[:x] + text + line[x + len(text):]
 
+@lru_cache(maxsize=1)
 def create_tui_mockup():
-    """Create a visual representation of the TUI"""
+    """Create a visual representation of the TUI (built once, as a tuple of lines)"""
     
     # Terminal dimensions
     width = 120
@@ -110,16 +107,15 @@ def create_tui_mockup():
     screen[38] = "─" * width
     screen[39] = footer.center(width)
     
-    return screen
+    return tuple(screen)
 
 def main():
     print("\n" + "="*50)
     print("TUI VISUAL MOCKUP - This is what you'd see in a terminal:")
     print("="*50 + "\n")
     
-    mockup = create_tui_mockup()
-    for line in mockup:
-        print(line)
+    # One write for the whole screen instead of a print per line
+    print("\n".join(create_tui_mockup()))
     
     print("\n" + "="*50)
     print("KEY FEATURES DEMONSTRATED:")
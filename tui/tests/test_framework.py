@@ -12,21 +12,38 @@ Key features:
 """
 
 import unittest
+import curses
 import tempfile
 import os
 import sys
 import io
 import time
 import threading
+import unicodedata
+import logging
+import random
+import re
 from unittest.mock import Mock, patch, MagicMock
 from typing import List, Dict, Any, Optional, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from contextlib import contextmanager
+from collections import deque
 
 # Add parent directories to path for importing TUI components
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-@dataclass
+# Headless runs provoke expected engine errors; keep them out of the
+# engine's tui_engine.log (basicConfig is a no-op once root has a handler)
+logging.getLogger().addHandler(logging.NullHandler())
+
+from core.tui_engine import TUIEngine, TerminalInfo
+from ui.components import PaneType, create_agent_manager_ui
+from data.file_parser import AgentInfo, FileParser, HANDOFF_HEAD_BYTES, _iter_review_items
+
+# Slotted records where supported (3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class MockTerminalConfig:
     """Configuration for mock terminal environment"""
     width: int = 80
@@ -36,7 +53,7 @@ class MockTerminalConfig:
     platform: str = "linux"
     term_type: str = "xterm-256color"
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TestResult:
     """Structured test result with metrics"""
     test_name: str
@@ -51,32 +68,56 @@ class MockCursesWindow:
     def __init__(self, height: int, width: int):
         self.height = height
         self.width = width
-        self.content = [[' ' for _ in range(width)] for _ in range(height)]
         self.cursor_y = 0
         self.cursor_x = 0
-        self.attributes = {}
+        self.clear()
         
     def getmaxyx(self):
         return (self.height, self.width)
         
     def addstr(self, y: int, x: int, text: str, attr: int = 0):
         if 0 <= y < self.height and 0 <= x < self.width:
-            for i, char in enumerate(text):
-                if x + i < self.width:
-                    self.content[y][x + i] = char
-                    self.attributes[(y, x + i)] = attr
+            # Rows are strings: one slice-and-concat per call, not per cell
+            end = min(x + len(text), self.width)
+            row = self.content[y]
+            self.content[y] = row[:x] + text[:end - x] + row[end:]
+            if attr or self.attributes is not None:
+                self._attribute_rows()[y][x:end] = [attr] * (end - x)
                     
+    def chgat(self, y: int, x: int, num: int, attr: int = 0):
+        if 0 <= y < self.height:
+            start, end = max(0, x), min(self.width, x + num)
+            if start < end and (attr or self.attributes is not None):
+                self._attribute_rows()[y][start:end] = [attr] * (end - start)
+                
+    def _attribute_rows(self) -> List[List[int]]:
+        """Per-row attribute lists, allocated on the first nonzero attribute"""
+        if self.attributes is None:
+            self.attributes = [[0] * self.width for _ in range(self.height)]
+        return self.attributes
+                
     def getch(self):
         # Return -1 (no input) by default
         return -1
         
     def clear(self):
-        self.content = [[' ' for _ in range(self.width)] for _ in range(self.height)]
-        self.attributes = {}
+        # One row string per line; attributes stay unallocated (all 0)
+        # until something nonzero is drawn
+        self.content = [' ' * self.width] * self.height
+        self.attributes = None
+        
+    def erase(self):
+        self.clear()
         
     def refresh(self):
         pass  # No-op for mock
         
+    def noutrefresh(self):
+        pass  # No-op for mock
+        
+    def leaveok(self, flag: bool):
+        pass  # No-op for mock
+        
     def keypad(self, enable: bool):
         pass  # No-op for mock
         
@@ -92,18 +133,23 @@ class MockCursesWindow:
     def get_line_content(self, y: int) -> str:
         """Get entire line content as string"""
         if 0 <= y < self.height:
-            return ''.join(self.content[y]).rstrip()
+            return self.content[y].rstrip()
         return ''
         
     def find_text(self, text: str) -> List[tuple]:
         """Find all occurrences of text and return positions"""
+        # One scan over the whole screen; rows are full width, so each
+        # offset maps back to (y, x) with divmod
+        screen = '\n'.join(self.content)
+        stride = self.width + 1
         positions = []
-        for y in range(self.height):
-            line = self.get_line_content(y)
-            x = line.find(text)
-            while x != -1:
+        i = screen.find(text)
+        while i != -1:
+            y, x = divmod(i, stride)
+            # Matches must stay within the row's visible (rstripped) text
+            if x + len(text) <= len(self.content[y].rstrip()):
                 positions.append((y, x))
-                x = line.find(text, x + 1)
+            i = screen.find(text, i + 1)
         return positions
 
 class MockCurses:
@@ -175,18 +221,37 @@ class MockCurses:
     def color_pair(self, pair_num: int):
         return pair_num  # Just return the pair number for testing
         
+    def doupdate(self):
+        pass  # No-op for mock
+        
     def resizeterm(self, lines: int, cols: int):
         if self.stdscr:
             self.stdscr.height = lines
             self.stdscr.width = cols
-            self.stdscr.content = [[' ' for _ in range(cols)] for _ in range(lines)]
+            self.stdscr.clear()
+
+def patch_curses(mock_curses: MockCurses):
+    """Patch the curses functions the engine calls with mock_curses, as one patcher"""
+    return patch.multiple(
+        'curses',
+        initscr=mock_curses.initscr,
+        endwin=mock_curses.endwin,
+        noecho=mock_curses.noecho,
+        cbreak=mock_curses.cbreak,
+        curs_set=mock_curses.curs_set,
+        has_colors=mock_curses.has_colors,
+        start_color=mock_curses.start_color,
+        use_default_colors=mock_curses.use_default_colors,
+        init_pair=mock_curses.init_pair,
+        color_pair=mock_curses.color_pair,
+        doupdate=mock_curses.doupdate
+    )
 
 class KeyboardSimulator:
     """Simulates keyboard input for automated testing"""
     
     def __init__(self):
-        self.key_queue = []
-        self.current_index = 0
+        self.key_queue = deque()  # Consumed keys are popped, not kept
         
     def add_keys(self, keys: List[int]):
         """Add a sequence of keys to simulate"""
@@ -194,8 +259,7 @@ class KeyboardSimulator:
         
     def add_key_sequence(self, sequence: str):
         """Add a string as a sequence of key presses"""
-        for char in sequence:
-            self.key_queue.append(ord(char))
+        self.key_queue.extend(map(ord, sequence))
             
     def add_special_key(self, key_constant: int):
         """Add a special key (arrow keys, etc.)"""
@@ -203,20 +267,17 @@ class KeyboardSimulator:
         
     def get_next_key(self):
         """Get the next key in the simulation sequence"""
-        if self.current_index < len(self.key_queue):
-            key = self.key_queue[self.current_index]
-            self.current_index += 1
-            return key
+        if self.key_queue:
+            return self.key_queue.popleft()
         return -1  # No more keys
         
     def has_more_keys(self):
         """Check if there are more keys to simulate"""
-        return self.current_index < len(self.key_queue)
+        return bool(self.key_queue)
         
     def reset(self):
         """Reset the simulator"""
-        self.current_index = 0
-        self.key_queue = []
+        self.key_queue.clear()
 
 class FileSystemMock:
     """Mock file system for testing file operations"""
@@ -262,38 +323,36 @@ A new-file.py
         
     def create_review_file(self, critical_items: int = 0, high_items: int = 0, medium_items: int = 0):
         """Create a mock review queue file"""
-        content = f"""# Human Review Queue - Sprint #2
+        parts = ["""# Human Review Queue - Sprint #2
 
 **Last Updated**: 2025-06-25 14:30:22
 **Review Status**: 🟢 All Clear
 
 ## 🚨 CRITICAL (Review Immediately)
-"""
+"""]
         
-        for i in range(critical_items):
-            content += f"""
+        parts.extend(f"""
 - **[agent-{i+1}]** - Critical test item {i+1} - **BLOCKING** [agent-{i+2}]
   - **Impact**: Test impact
   - **Decision Needed**: Test decision
   - **Added**: 2025-06-25 14:30:22
-"""
+""" for i in range(critical_items))
             
-        content += "\n## 🟡 HIGH PRIORITY (Daily Review)\n"
-        for i in range(high_items):
-            content += f"""
+        parts.append("\n## 🟡 HIGH PRIORITY (Daily Review)\n")
+        parts.extend(f"""
 - **[agent-{i+1}]** - High priority test item {i+1}
   - **Confidence**: 🟡
   - **Added**: 2025-06-25 14:30:22
-"""
+""" for i in range(high_items))
             
-        content += "\n## 🟢 MEDIUM PRIORITY (Weekly Batch Review)\n"
-        for i in range(medium_items):
-            content += f"""
+        parts.append("\n## 🟢 MEDIUM PRIORITY (Weekly Batch Review)\n")
+        parts.extend(f"""
 - **[agent-{i+1}]** - Medium priority test item {i+1}
   - **Type**: improvement
   - **Added**: 2025-06-25 14:30:22
-"""
+""" for i in range(medium_items))
             
+        content = "".join(parts)
         self.create_file("docs/sprints/human-review.md", content)
         
     def file_exists(self, path: str) -> bool:
@@ -306,8 +365,11 @@ A new-file.py
         
     def list_files(self, pattern: str = "*") -> List[str]:
         """List files matching a pattern"""
+        if pattern == "*":
+            return list(self.files)
         import fnmatch
-        return [f for f in self.files.keys() if fnmatch.fnmatch(f, pattern)]
+        # filter() compiles the pattern once for the whole list
+        return fnmatch.filter(self.files, pattern)
 
 class TUITestCase(unittest.TestCase):
     """Base test case for TUI components with common utilities"""
@@ -327,55 +389,47 @@ class TUITestCase(unittest.TestCase):
     @contextmanager
     def mock_terminal_environment(self):
         """Context manager for mocking terminal environment"""
-        with patch('curses.initscr', self.mock_curses.initscr), \
-             patch('curses.endwin', self.mock_curses.endwin), \
-             patch('curses.noecho', self.mock_curses.noecho), \
-             patch('curses.cbreak', self.mock_curses.cbreak), \
-             patch('curses.curs_set', self.mock_curses.curs_set), \
-             patch('curses.has_colors', self.mock_curses.has_colors), \
-             patch('curses.start_color', self.mock_curses.start_color), \
-             patch('curses.use_default_colors', self.mock_curses.use_default_colors), \
-             patch('curses.init_pair', self.mock_curses.init_pair), \
-             patch('curses.color_pair', self.mock_curses.color_pair):
+        with patch_curses(self.mock_curses):
             yield
             
     def simulate_terminal_resize(self, new_width: int, new_height: int):
         """Simulate a terminal resize event"""
-        self.terminal_config.width = new_width
-        self.terminal_config.height = new_height
+        self.terminal_config = replace(self.terminal_config, width=new_width, height=new_height)
+        self.mock_curses.config = self.terminal_config
         self.mock_curses.resizeterm(new_height, new_width)
         
     def assert_text_displayed(self, text: str, message: str = None):
         """Assert that specific text is displayed on screen"""
-        if not self.mock_curses.stdscr:
+        screen = self.mock_curses.stdscr
+        if not screen:
             self.fail("No mock screen available")
             
-        positions = self.mock_curses.stdscr.find_text(text)
+        positions = screen.find_text(text)
         if not positions:
-            screen_content = "\n".join([
-                self.mock_curses.stdscr.get_line_content(y) 
-                for y in range(self.mock_curses.stdscr.height)
-            ])
+            screen_content = "\n".join(map(screen.get_line_content, range(screen.height)))
             self.fail(f"Text '{text}' not found on screen. Screen content:\n{screen_content}")
             
     def assert_text_at_position(self, y: int, x: int, expected: str):
         """Assert that specific text appears at a specific position"""
-        if not self.mock_curses.stdscr:
+        screen = self.mock_curses.stdscr
+        if not screen:
             self.fail("No mock screen available")
             
-        actual = ""
-        for i in range(len(expected)):
-            if x + i < self.mock_curses.stdscr.width:
-                actual += self.mock_curses.stdscr.get_content_at(y, x + i)
+        end = min(x + len(expected), screen.width)
+        if 0 <= y < screen.height and x >= 0:
+            actual = screen.content[y][x:end]
+        else:
+            get_content_at = screen.get_content_at
+            actual = "".join(get_content_at(y, col) for col in range(x, end))
                 
         self.assertEqual(actual.strip(), expected.strip(), 
                         f"Expected '{expected}' at position ({y},{x}), got '{actual}'")
                         
     def measure_performance(self, func: Callable, *args, **kwargs) -> Dict[str, Any]:
         """Measure performance of a function"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        execution_time = time.time() - start_time
+        execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
         
         return {
             'execution_time': execution_time,
@@ -387,8 +441,6 @@ class TUIEngineTests(TUITestCase):
     
     def test_engine_initialization(self):
         """Test TUI engine initialization"""
-        from core.tui_engine import TUIEngine
-        
         with self.mock_terminal_environment():
             engine = TUIEngine()
             self.assertIsNotNone(engine)
@@ -396,8 +448,6 @@ class TUIEngineTests(TUITestCase):
             
     def test_terminal_detection(self):
         """Test terminal capability detection"""
-        from core.tui_engine import TUIEngine
-        
         with self.mock_terminal_environment():
             engine = TUIEngine()
             engine._initialize_curses()
@@ -408,7 +458,6 @@ class TUIEngineTests(TUITestCase):
             
     def test_signal_handling(self):
         """Test signal handling for resize events"""
-        from core.tui_engine import TUIEngine
         import signal
         
         with self.mock_terminal_environment():
@@ -421,8 +470,6 @@ class TUIEngineTests(TUITestCase):
             
     def test_safe_drawing(self):
         """Test safe drawing with bounds checking"""
-        from core.tui_engine import TUIEngine
-        
         with self.mock_terminal_environment():
             engine = TUIEngine()
             engine._initialize_curses()
@@ -435,10 +482,19 @@ class TUIEngineTests(TUITestCase):
             result = engine.safe_addstr(100, 100, "Test")
             self.assertFalse(result)
             
+    def test_draw_batches_output(self):
+        """Test that each frame is flushed with a single doupdate"""
+        with self.mock_terminal_environment(), patch('curses.doupdate') as doupdate:
+            engine = TUIEngine()
+            engine._initialize_curses()
+            engine.set_draw_handler(lambda stdscr, info: stdscr.addstr(0, 0, "Frame"))
+            
+            engine._safe_draw()
+            doupdate.assert_called_once()
+            self.assert_text_displayed("Frame")
+            
     def test_error_recovery(self):
         """Test error handling and recovery"""
-        from core.tui_engine import TUIEngine
-        
         with self.mock_terminal_environment():
             engine = TUIEngine()
             
@@ -449,6 +505,242 @@ class TUIEngineTests(TUITestCase):
             engine.error_count = 3
             self.assertTrue(engine.error_count < engine.max_errors)
 
+class IncrementalRedrawTests(TUITestCase):
+    """Tests for dirty-pane drawing and per-row diffing on a mock screen"""
+    
+    def setUp(self):
+        super().setUp()
+        self.screen = self.mock_curses.initscr()
+        self.info = TerminalInfo(self.terminal_config.height, self.terminal_config.width,
+                                 True, True, "linux", "xterm-256color")
+        self.layout, self.components = create_agent_manager_ui()
+        self.components[PaneType.AGENTS].set_agents(
+            [AgentInfo(agent_id=f"agent-{i}", status="active") for i in range(5)])
+        self.layout.set_focus(PaneType.AGENTS)
+        self.layout.update_layout(self.info.width, self.info.height)
+        
+        # Components clip against curses.LINES/COLS, which only initscr() sets
+        patcher = patch.multiple('curses', LINES=self.info.height, COLS=self.info.width, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.layout.draw_all(self.screen, self.info)  # Full first frame
+        
+    def test_idle_frame_paints_nothing(self):
+        """Test that a frame with no dirty panes makes no drawing calls"""
+        with patch.object(self.screen, 'addstr') as addstr, patch.object(self.screen, 'chgat') as chgat:
+            self.layout.draw_all(self.screen, self.info, set())
+        addstr.assert_not_called()
+        chgat.assert_not_called()
+        
+    def test_selection_move_restyles_two_rows(self):
+        """Test that moving the selection only restyles the old and new rows"""
+        agents = self.components[PaneType.AGENTS]
+        first_row = agents.y + 1
+        
+        agents.move_selection(1)
+        with patch.object(self.screen, 'addstr', wraps=self.screen.addstr) as addstr, \
+                patch.object(self.screen, 'chgat', wraps=self.screen.chgat) as chgat:
+            self.layout.draw_all(self.screen, self.info, {PaneType.AGENTS})
+            
+        self.assertEqual(sorted(c.args[0] for c in chgat.call_args_list), [first_row, first_row + 1])
+        # Borders are redrawn, but no content row is rewritten
+        content_writes = [c.args for c in addstr.call_args_list if c.args[1] == agents.x + 1]
+        self.assertEqual(content_writes, [])
+        self.assertEqual(self.screen.attributes[first_row + 1][agents.x + 1], curses.A_REVERSE)
+        self.assertEqual(self.screen.attributes[first_row][agents.x + 1], curses.A_NORMAL)
+
+    @staticmethod
+    def terminal_cells(text: str) -> int:
+        """Screen cells text takes on a UTF-8 terminal (wide emoji count twice)"""
+        return sum(2 if unicodedata.east_asian_width(char) in ("W", "F") else 1 for char in text)
+        
+    def test_rows_fit_pane_in_terminal_cells(self):
+        """Test that rewritten rows with 2-cell icons never spill past the pane"""
+        agents = self.components[PaneType.AGENTS]
+        content_width = agents.width - 2
+        agents.set_agents([AgentInfo(agent_id=f"agent-{i}" + "x" * (i * 6), status="blocked", confidence="low")
+                           for i in range(5)])
+        
+        with patch.object(self.screen, 'addstr', wraps=self.screen.addstr) as addstr:
+            self.layout.draw_all(self.screen, self.info, {PaneType.AGENTS})
+            
+        rows = [c.args[2] for c in addstr.call_args_list if c.args[1] == agents.x + 1]
+        self.assertEqual(len(rows), 5)  # Blank rows below are unchanged
+        for row in rows:
+            self.assertEqual(self.terminal_cells(row), content_width, repr(row))
+        self.assertTrue(any("🔴" in row and row.rstrip().endswith("…") for row in rows))
+
+class ProjectStateCacheTests(unittest.TestCase):
+    """Tests for the stamp-keyed parse cache"""
+    
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.tempdir.name)
+        
+        filesystem = FileSystemMock()
+        filesystem.create_review_file(critical_items=1, high_items=2)
+        for name, content in filesystem.files.items():
+            self.write(name, content)
+        self.handoffs = [f"handoff-20250625_14302{i}.md" for i in range(3)]
+        for i, name in enumerate(self.handoffs):
+            self.write(name, f"# Handoff\n\n**Description**: task {i}\n**Confidence**: high\n")
+            
+    def write(self, path: str, content: str):
+        """Write a source file, creating its directory"""
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+            
+    def test_reparse_reads_only_changed_files(self):
+        """Test that a forced reparse reads only the files whose stamps changed"""
+        parser = FileParser()
+        state = parser.parse_project_state(force_refresh=True)
+        self.assertEqual(parser.read_count, len(self.handoffs) + 1)
+        self.assertEqual(len(state.agents), len(self.handoffs))
+        
+        parser.parse_project_state(force_refresh=True)
+        self.assertEqual(parser.read_count, 0)
+        
+        self.write(self.handoffs[1], "# Handoff\n\n**Description**: task changed\n**Confidence**: low\n")
+        state = parser.parse_project_state(force_refresh=True)
+        self.assertEqual(parser.read_count, 1)
+        self.assertEqual(state.agents["handoff-20250625_143021"].current_task, "task changed")
+        self.assertEqual(state.agents["handoff-20250625_143020"].current_task, "task 0")
+
+class ReviewItemScannerTests(unittest.TestCase):
+    """Tests for the find()-based review item scanner"""
+    
+    # The pattern the scanner replaced; it defines the expected behaviour
+    REFERENCE_PATTERN = re.compile(
+        r'- \*\*\[([^\]]+)\]\*\* - (.+?)(?=\n  -|\n\n|\n- \*\*|\Z)', re.DOTALL)
+    
+    def assert_items(self, content: str, expected: List[tuple]):
+        """Assert the scanner yields expected and agrees with the reference pattern"""
+        items = list(_iter_review_items(content))
+        self.assertEqual(items, expected)
+        self.assertEqual(items, [m.groups() for m in self.REFERENCE_PATTERN.finditer(content)])
+        
+    def test_empty_id_is_skipped(self):
+        """Test that an item with an empty agent id is not an item"""
+        self.assert_items("- **[]** - nobody\n- **[agent-1]** - somebody",
+                          [("agent-1", "somebody")])
+        
+    def test_dangling_item_at_section_end(self):
+        """Test that a trailing item with no description is dropped"""
+        self.assert_items("- **[agent-1]** - first\n- **[agent-2]** - ",
+                          [("agent-1", "first")])
+        self.assert_items("- **[agent-1]** - first\n- **[agent-2]** -",
+                          [("agent-1", "first")])
+        
+    def test_continuation_lines(self):
+        """Test that unindented continuation lines stay in the block"""
+        self.assert_items("- **[agent-1]** - first line\nsecond line\n  - **Added**: 2025-06-25 14:30:22\n",
+                          [("agent-1", "first line\nsecond line")])
+        
+    def test_single_character_block(self):
+        """Test a one-character description ended by a blank line"""
+        self.assert_items("- **[agent-1]** - x\n\n- **[agent-2]** - y\n\n",
+                          [("agent-1", "x"), ("agent-2", "y")])
+        
+    def test_adjacent_items_without_sub_fields(self):
+        """Test items that follow each other with no sub-fields between them"""
+        self.assert_items("- **[a]** - one\n- **[b]** - two\n- **[c]** - three",
+                          [("a", "one"), ("b", "two"), ("c", "three")])
+        
+    def test_matches_reference_on_generated_sections(self):
+        """Test the scanner against the reference pattern on generated sections"""
+        pieces = ["- **[a]** - ", "- **[]** - ", "- **[b]** -", "x", "desc", "\n", "\n\n",
+                  "\n  - **Added**: now", "\n- **", "]** - ", "  -", "[", "]"]
+        rng = random.Random(1)
+        for _ in range(2000):
+            content = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+            self.assertEqual(list(_iter_review_items(content)),
+                             [m.groups() for m in self.REFERENCE_PATTERN.finditer(content)],
+                             repr(content))
+
+class HandoffParsingTests(unittest.TestCase):
+    """Tests for handoff metadata extraction and the head-first read"""
+    
+    FIELDS = ("**Description**: early task\n**Confidence**: high\n"
+              "**Priority**: high\n**Handoff Reason**: done\n")
+    FILLER = "filler line of text here\n" * 700  # Pushes later text past the head
+    
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.parser = FileParser()
+        
+    def tearDown(self):
+        self.tempdir.cleanup()
+        
+    def parse(self, content: str) -> AgentInfo:
+        """Parse content as a handoff file"""
+        path = os.path.join(self.tempdir.name, "handoff-20250101_120000.md")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        agent = self.parser._parse_handoff_file(path)
+        self.assertIsNotNone(agent)
+        return agent
+        
+    def settles(self, head: str) -> bool:
+        """Whether a file head alone settles the metadata"""
+        return self.parser._extract_handoff_metadata(AgentInfo(agent_id="a"), head, False)
+        
+    def test_description_sharing_line_with_confidence(self):
+        """Test that a same-line Confidence is also read, not swallowed by Description"""
+        agent = self.parse("# H\n\n**Description**: Fix the parser **Confidence**: high\n**Priority**: low\n")
+        self.assertEqual(agent.current_task, "Fix the parser **Confidence**: high")
+        self.assertEqual(agent.confidence, "high")
+        self.assertEqual(agent.priority, "low")
+        
+    def test_description_on_next_line(self):
+        """Test a Description label followed by a newline"""
+        agent = self.parse("# H\n\n**Description**:\nNext line task\n**Confidence**: low\n")
+        self.assertEqual(agent.current_task, "Next line task")
+        self.assertEqual(agent.confidence, "low")
+        
+    def test_repeated_fields_first_wins(self):
+        """Test that the first occurrence of each field is used"""
+        agent = self.parse("# H\n\n" + self.FIELDS +
+                           "**Description**: second\n**Confidence**: low\n"
+                           "**Priority**: low\n**Handoff Reason**: blocked\n")
+        self.assertEqual((agent.current_task, agent.confidence, agent.priority, agent.status),
+                         ("early task", "high", "high", "completed"))
+        
+    def test_metadata_past_head_without_blockers(self):
+        """Test fields found only after the first HANDOFF_HEAD_BYTES"""
+        content = "# H\n\n" + self.FILLER + self.FIELDS
+        self.assertGreater(len(content), HANDOFF_HEAD_BYTES)
+        agent = self.parse(content)
+        self.assertEqual((agent.current_task, agent.confidence, agent.priority, agent.status),
+                         ("early task", "high", "high", "completed"))
+        self.assertEqual(self.parser.read_count, 1)
+        
+    def test_metadata_past_head_with_blockers(self):
+        """Test fields and a Blockers section found only after the head"""
+        content = "# H\n\n" + self.FILLER + self.FIELDS + "\n## 🚨 Blockers\n- waiting on api\n\n## Next\n"
+        agent = self.parse(content)
+        self.assertEqual(agent.current_task, "early task")
+        self.assertEqual(agent.blockers, ["waiting on api"])
+        self.assertEqual(agent.status, "blocked")
+        
+    def test_blockers_past_head(self):
+        """Test that a Blockers section after the head still blocks the agent"""
+        agent = self.parse("# H\n\n" + self.FIELDS + self.FILLER + "## 🚨 Blockers\n- late blocker\n## End\n")
+        self.assertEqual(agent.blockers, ["late blocker"])
+        self.assertEqual(agent.status, "blocked")
+        
+    def test_head_settles_only_when_complete(self):
+        """Test when a file head is enough to settle the metadata"""
+        blockers = "## 🚨 Blockers\n- api\n## End\n"
+        self.assertTrue(self.settles(self.FIELDS + blockers))
+        self.assertFalse(self.settles(self.FIELDS))  # Blockers may follow
+        self.assertFalse(self.settles(self.FIELDS + "## 🚨 Blockers\n- api\n"))  # Section may go on
+        self.assertFalse(self.settles(self.FIELDS.replace("**Priority**: high\n", "") + blockers))
+        self.assertFalse(self.settles(blockers + self.FIELDS[:-3]))  # Last value may be cut off
+
 def run_tui_tests(verbose: bool = False) -> List[TestResult]:
     """Run all TUI tests and return results"""
     
@@ -458,6 +750,10 @@ def run_tui_tests(verbose: bool = False) -> List[TestResult]:
     # Add test cases
     loader = unittest.TestLoader()
     test_suite.addTest(loader.loadTestsFromTestCase(TUIEngineTests))
+    test_suite.addTest(loader.loadTestsFromTestCase(IncrementalRedrawTests))
+    test_suite.addTest(loader.loadTestsFromTestCase(ProjectStateCacheTests))
+    test_suite.addTest(loader.loadTestsFromTestCase(ReviewItemScannerTests))
+    test_suite.addTest(loader.loadTestsFromTestCase(HandoffParsingTests))
     
     # Run tests with custom result collector
     test_results = []
@@ -466,32 +762,32 @@ def run_tui_tests(verbose: bool = False) -> List[TestResult]:
         def __init__(self, stream=None, descriptions=None, verbosity=None, **kwargs):
             super().__init__(stream, descriptions, verbosity)
             self.test_results = test_results
+            self._start_ns = 0
             
-        def addSuccess(self, test):
-            super().addSuccess(test)
+        def startTest(self, test):
+            super().startTest(test)
+            self._start_ns = time.perf_counter_ns()
+            
+        def _record(self, test, passed: bool, err=None):
+            """Append the outcome with the time since startTest"""
             self.test_results.append(TestResult(
                 test_name=str(test),
-                passed=True,
-                execution_time=0.0  # We'd need to measure this properly
+                passed=passed,
+                execution_time=(time.perf_counter_ns() - self._start_ns) * 1e-9,
+                error_message=str(err[1]) if err else None
             ))
             
+        def addSuccess(self, test):
+            super().addSuccess(test)
+            self._record(test, True)
+            
         def addError(self, test, err):
             super().addError(test, err)
-            self.test_results.append(TestResult(
-                test_name=str(test),
-                passed=False,
-                execution_time=0.0,
-                error_message=str(err[1])
-            ))
+            self._record(test, False, err)
             
         def addFailure(self, test, err):
             super().addFailure(test, err)
-            self.test_results.append(TestResult(
-                test_name=str(test),
-                passed=False,
-                execution_time=0.0,
-                error_message=str(err[1])
-            ))
+            self._record(test, False, err)
     
     # Run the tests
     runner = unittest.TextTestRunner(
@@ -509,36 +805,36 @@ def benchmark_tui_performance():
     
     benchmarks = {}
     
-    # Benchmark terminal initialization
-    def init_benchmark():
-        from core.tui_engine import TUIEngine
-        with patch('curses.initscr'), \
-             patch('curses.endwin'), \
-             patch('curses.noecho'), \
-             patch('curses.cbreak'):
+    # Benchmark terminal initialization; patch once so the loop times the
+    # engine rather than patch setup and teardown
+    mock_curses = MockCurses(MockTerminalConfig())
+    
+    start_ns = time.perf_counter_ns()
+    with patch_curses(mock_curses):
+        for _ in range(100):
             engine = TUIEngine()
             engine._initialize_curses()
-            
-    start_time = time.time()
-    for _ in range(100):
-        init_benchmark()
-    benchmarks['initialization'] = time.time() - start_time
+    benchmarks['initialization'] = (time.perf_counter_ns() - start_ns) * 1e-9
+    
+    # Benchmark drawing operations on one window, cleared each frame, so
+    # window setup stays out of the measurement
+    config = MockTerminalConfig(width=120, height=40)
+    stdscr = MockCurses(config).initscr()
+    
+    coords = [(y, x) for y in range(40) for x in range(0, 120, 10)]
     
-    # Benchmark drawing operations
     def draw_benchmark():
-        config = MockTerminalConfig(width=120, height=40)
-        mock_curses = MockCurses(config)
-        stdscr = mock_curses.initscr()
+        stdscr.clear()
         
         # Draw a lot of text
-        for y in range(40):
-            for x in range(0, 120, 10):
-                stdscr.addstr(y, x, "Test text")
+        addstr = stdscr.addstr
+        for y, x in coords:
+            addstr(y, x, "Test text")
                 
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     for _ in range(1000):
         draw_benchmark()
-    benchmarks['drawing'] = time.time() - start_time
+    benchmarks['drawing'] = (time.perf_counter_ns() - start_ns) * 1e-9
     
     return benchmarks
 
@@ -13,7 +13,10 @@ Key features:
 
 import curses
 import math
-from typing import Dict, List, Optional, Tuple, Any, Callable
+import unicodedata
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple, Any, Callable, Union
 from dataclasses import dataclass
 from enum import Enum
 import sys
@@ -23,6 +26,38 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from data.file_parser import AgentInfo, ReviewItem
 
+# Slotted records where supported (3.10+), as in data.file_parser
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@lru_cache(maxsize=1024)
+def _char_cells(char: str) -> int:
+    """Terminal cells taken by one character: 2 for wide, 0 for combining/joiners"""
+    if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+    
+def _fit_cells(text: str, width: int) -> str:
+    """text truncated ("…") or space-padded to exactly width terminal cells.
+    
+    Emoji icons take two cells, so len() overstates what fits and rows
+    padded by character count spill into the neighbouring pane.
+    """
+    if text.isascii():
+        return text[:width-1] + "…" if len(text) > width else text.ljust(width)
+    cells = [_char_cells(char) for char in text]
+    used = sum(cells)
+    if used <= width:
+        return text + " " * (width - used)
+        
+    # Keep what fits ahead of the ellipsis; a wide character that would
+    # straddle the edge is dropped and its cell padded
+    used = 0
+    for i, char_cells in enumerate(cells):
+        if used + char_cells > width - 1:
+            break
+        used += char_cells
+    return text[:i] + "…" + " " * (width - 1 - used)
+
 class PaneType(Enum):
     """Types of UI panes"""
     AGENTS = "agents"
@@ -31,7 +66,7 @@ class PaneType(Enum):
     DETAILS = "details"
     STATUS = "status"
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PaneConfig:
     """Configuration for a UI pane"""
     title: str
@@ -42,7 +77,7 @@ class PaneConfig:
     scrollable: bool = True
     border: bool = True
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Layout:
     """Terminal layout configuration"""
     total_width: int
@@ -64,12 +99,24 @@ class UIComponent:
         self.is_focused = False
         self.content_height = 0
         
+        # Content rows as last written; partial redraws skip unchanged rows
+        self._drawn_rows: List[Optional[Tuple[str, int]]] = []
+        
+        # Top and bottom border strings for the current (width, title)
+        self._border_key: Optional[Tuple[int, str]] = None
+        self._border_lines: Tuple[str, str] = ("", "")
+        
     def set_dimensions(self, y: int, x: int, height: int, width: int):
         """Set component dimensions"""
         self.y = y
         self.x = x
         self.height = max(height, self.config.min_height)
         self.width = max(width, self.config.min_width)
+        self.invalidate_rows()
+        
+    def invalidate_rows(self):
+        """Forget what is on screen, e.g. after the screen was cleared"""
+        self._drawn_rows = []
         
     def set_focus(self, focused: bool):
         """Set focus state"""
@@ -95,6 +142,15 @@ class UIComponent:
         """Get content lines for display (override in subclasses)"""
         return []
         
+    def get_visible_lines(self, start: int, count: int) -> Tuple[List[str], int]:
+        """Content lines start..start+count and the total line count.
+        
+        Subclasses whose lines map one-to-one onto items override this to
+        format only the visible slice.
+        """
+        lines = self.get_content_lines()
+        return lines[start:start + count], len(lines)
+        
     def handle_key(self, key: int) -> Optional[str]:
         """Handle keyboard input (override in subclasses)"""
         return None
@@ -130,60 +186,78 @@ class UIComponent:
             # Determine border style based on focus
             border_attr = curses.A_REVERSE if self.is_focused else curses.A_NORMAL
             
-            # Top border with title
-            title = f" {self.config.title} "
-            if self.is_focused:
-                title = f"┌─ {self.config.title} ─"
-            else:
+            # Focus only changes the attribute, so the strings are rebuilt
+            # just when the width or title does
+            border_key = (self.width, self.config.title)
+            if border_key != self._border_key:
+                # Top border with title, padded to width
                 title = f"┌─ {self.config.title} ─"
+                title_padded = title + "─" * max(0, self.width - len(title) - 1) + "┐"
+                if len(title_padded) > self.width:
+                    title_padded = title_padded[:self.width-1] + "┐"
+                bottom_line = "└" + "─" * (self.width - 2) + "┘"
+                self._border_lines = (title_padded[:self.width], bottom_line[:self.width])
+                self._border_key = border_key
+            top_line, bottom_line = self._border_lines
                 
-            # Pad title to width
-            title_padded = title + "─" * max(0, self.width - len(title) - 1) + "┐"
-            if len(title_padded) > self.width:
-                title_padded = title_padded[:self.width-1] + "┐"
-                
-            stdscr.addstr(self.y, self.x, title_padded[:self.width], border_attr)
-            
-            # Side borders
-            for i in range(1, self.height - 1):
-                if self.y + i < curses.LINES and self.x < curses.COLS:
-                    stdscr.addstr(self.y + i, self.x, "│", border_attr)
-                if self.y + i < curses.LINES and self.x + self.width - 1 < curses.COLS:
-                    stdscr.addstr(self.y + i, self.x + self.width - 1, "│", border_attr)
+            stdscr.addstr(self.y, self.x, top_line, border_attr)
+            
+            # Side borders: clip rows and columns once, not per row
+            rows = range(self.y + 1, min(self.y + self.height - 1, curses.LINES))
+            cols = [col for col in (self.x, self.x + self.width - 1) if col < curses.COLS]
+            for row in rows:
+                for col in cols:
+                    stdscr.addstr(row, col, "│", border_attr)
                     
             # Bottom border
             if self.y + self.height - 1 < curses.LINES:
-                bottom_line = "└" + "─" * (self.width - 2) + "┘"
-                stdscr.addstr(self.y + self.height - 1, self.x, bottom_line[:self.width], border_attr)
+                stdscr.addstr(self.y + self.height - 1, self.x, bottom_line, border_attr)
                 
         except curses.error:
             pass  # Ignore drawing errors
             
     def _draw_content(self, stdscr, y: int, x: int, height: int, width: int, terminal_info):
         """Draw component content (override in subclasses)"""
-        lines = self.get_content_lines()
-        self.content_height = len(lines)
-        
-        # Calculate visible range
+        # Only the visible slice is formatted
         start_line = self.scroll_offset
-        end_line = min(len(lines), start_line + height)
-        
-        # Draw visible lines
-        for i, line_idx in enumerate(range(start_line, end_line)):
-            if i >= height:
-                break
-                
-            line = lines[line_idx]
-            
-            # Truncate line to fit width
-            if len(line) > width:
-                line = line[:width-1] + "…"
+        visible, self.content_height = self.get_visible_lines(start_line, max(0, height))
+        if width <= 0:
+            return
+            
+        if len(self._drawn_rows) != height:
+            self._drawn_rows = [None] * height
+            
+        # Build the whole frame for this pane first; rows past the content
+        # are blanked so a shrinking list leaves nothing behind
+        selected = self.selected_index if self.is_focused else -1
+        blank = (" " * width, curses.A_NORMAL)
+        rows = []
+        for line_idx, line in enumerate(visible, start_line):
+            # Truncate or pad line to exactly the width, in terminal cells
+            line = _fit_cells(line, width)
                 
             # Highlight selected line
-            attr = curses.A_REVERSE if (line_idx == self.selected_index and self.is_focused) else curses.A_NORMAL
-            
+            attr = curses.A_REVERSE if line_idx == selected else curses.A_NORMAL
+            rows.append((line, attr))
+        rows.extend([blank] * (height - len(rows)))
+        
+        # One list comparison settles the common nothing-changed case
+        if rows == self._drawn_rows:
+            return
+            
+        drawn = self._drawn_rows
+        for i, row in enumerate(rows):
+            previous = drawn[i]
+            if previous == row:
+                continue
+                
             try:
-                stdscr.addstr(y + i, x, line.ljust(width)[:width], attr)
+                if previous is not None and previous[0] == row[0]:
+                    # Only the highlight moved: restyle the cells in place
+                    stdscr.chgat(y + i, x, width, row[1])
+                else:
+                    stdscr.addstr(y + i, x, row[0], row[1])
+                drawn[i] = row
             except curses.error:
                 pass
 
@@ -223,33 +297,35 @@ class AgentListComponent(UIComponent):
             elif self.selected_index >= self.scroll_offset + visible_height:
                 self.scroll_offset = self.selected_index - visible_height + 1
                 
+    STATUS_ICONS = {
+        "active": "🟢",
+        "blocked": "🔴",
+        "completed": "✅", 
+        "idle": "⚪"
+    }
+    CONFIDENCE_ICONS = {
+        "high": "🟢",
+        "medium": "🟡",
+        "low": "🔴"
+    }
+    
+    def _format_agent(self, agent: AgentInfo) -> str:
+        """One list line for an agent"""
+        status_icon = self.STATUS_ICONS.get(agent.status, "❓")
+        confidence_icon = self.CONFIDENCE_ICONS.get(agent.confidence, "🟡")
+        return f"{status_icon} {agent.agent_id:<12} {confidence_icon}"
+        
     def get_content_lines(self) -> List[str]:
         """Generate agent list content"""
         if not self.agents:
             return ["No agents found"]
-            
-        lines = []
-        for agent in self.agents:
-            # Status icon
-            status_icon = {
-                "active": "🟢",
-                "blocked": "🔴",
-                "completed": "✅", 
-                "idle": "⚪"
-            }.get(agent.status, "❓")
-            
-            # Confidence icon
-            confidence_icon = {
-                "high": "🟢",
-                "medium": "🟡",
-                "low": "🔴"
-            }.get(agent.confidence, "🟡")
-            
-            # Format line
-            line = f"{status_icon} {agent.agent_id:<12} {confidence_icon}"
-            lines.append(line)
-            
-        return lines
+        return list(map(self._format_agent, self.agents))
+        
+    def get_visible_lines(self, start: int, count: int) -> Tuple[List[str], int]:
+        """Format only the agents in view"""
+        if not self.agents:
+            return super().get_visible_lines(start, count)
+        return list(map(self._format_agent, self.agents[start:start + count])), len(self.agents)
         
     def handle_key(self, key: int) -> Optional[str]:
         """Handle keyboard input for agent list"""
@@ -274,10 +350,16 @@ class TaskDetailsComponent(UIComponent):
         super().__init__(PaneType.TASKS, config)
         self.selected_agent: Optional[AgentInfo] = None
         
+        # Lines built for (agent, width, last-update text); wrapping is redone
+        # only when one of them changes
+        self._lines_cache: Optional[List[str]] = None
+        self._lines_key: Optional[Tuple] = None
+        
     def set_selected_agent(self, agent: Optional[AgentInfo]):
         """Set the agent to display details for"""
         self.selected_agent = agent
         self.scroll_offset = 0
+        self._lines_key = None
         
     def get_content_lines(self) -> List[str]:
         """Generate task details content"""
@@ -285,6 +367,20 @@ class TaskDetailsComponent(UIComponent):
             return ["No agent selected"]
             
         agent = self.selected_agent
+        
+        # The relative update time is the only input that changes by itself
+        if agent.last_update:
+            # Total hours so multi-day gaps are not wrapped at 24h
+            elapsed = max(0, int((datetime.now() - agent.last_update).total_seconds()))
+            hours, remainder = divmod(elapsed, 3600)
+            last_update_line = f"Last Update: {hours}h {remainder // 60}m ago"
+        else:
+            last_update_line = "Last Update: Unknown"
+            
+        key = (id(agent), self.width, last_update_line)
+        if key == self._lines_key:
+            return self._lines_cache
+            
         lines = []
         
         lines.append(f"Agent: {agent.agent_id}")
@@ -297,16 +393,7 @@ class TaskDetailsComponent(UIComponent):
         lines.append("")
         
         lines.append(f"Confidence: {agent.confidence}")
-        
-        if agent.last_update:
-            from datetime import datetime
-            time_ago = datetime.now() - agent.last_update
-            hours = time_ago.seconds // 3600
-            minutes = (time_ago.seconds // 60) % 60
-            lines.append(f"Last Update: {hours}h {minutes}m ago")
-        else:
-            lines.append("Last Update: Unknown")
-            
+        lines.append(last_update_line)
         lines.append("")
         
         if agent.files_owned:
@@ -323,6 +410,8 @@ class TaskDetailsComponent(UIComponent):
                 blocker_lines = self._wrap_text(f"  • {blocker}", self.width - 4)
                 lines.extend(blocker_lines)
                 
+        self._lines_key = key
+        self._lines_cache = lines
         return lines
         
     def _wrap_text(self, text: str, width: int) -> List[str]:
@@ -330,21 +419,25 @@ class TaskDetailsComponent(UIComponent):
         if not text:
             return [""]
             
-        words = text.split()
         lines = []
-        current_line = ""
-        
-        for word in words:
-            if not current_line:
-                current_line = word
-            elif len(current_line) + 1 + len(word) <= width:
-                current_line += " " + word
+        parts = []
+        line_len = 0
+        
+        # Track the line length instead of rebuilding the string per word
+        for word in text.split():
+            if not parts:
+                parts.append(word)
+                line_len = len(word)
+            elif line_len + 1 + len(word) <= width:
+                parts.append(word)
+                line_len += 1 + len(word)
             else:
-                lines.append(current_line)
-                current_line = word
+                lines.append(" ".join(parts))
+                parts = [word]
+                line_len = len(word)
                 
-        if current_line:
-            lines.append(current_line)
+        if parts:
+            lines.append(" ".join(parts))
             
         return lines if lines else [""]
 
@@ -361,11 +454,13 @@ class ReviewQueueComponent(UIComponent):
         super().__init__(PaneType.REVIEW, config)
         self.review_items: List[ReviewItem] = []
         
+    PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2}
+        
     def set_review_items(self, items: List[ReviewItem]):
         """Update review items"""
-        # Sort by priority
-        priority_order = {"critical": 0, "high": 1, "medium": 2}
-        self.review_items = sorted(items, key=lambda x: priority_order.get(x.priority, 3))
+        # Sort by priority; the key runs once per item, not per comparison
+        rank = self.PRIORITY_ORDER.get
+        self.review_items = sorted(items, key=lambda x: rank(x.priority, 3))
         self.selected_index = min(self.selected_index, len(self.review_items) - 1) if self.review_items else 0
         
     def get_selected_item(self) -> Optional[ReviewItem]:
@@ -386,30 +481,34 @@ class ReviewQueueComponent(UIComponent):
             elif self.selected_index >= self.scroll_offset + visible_height:
                 self.scroll_offset = self.selected_index - visible_height + 1
                 
+    PRIORITY_ICONS = {
+        "critical": "🚨",
+        "high": "🟡", 
+        "medium": "🟢"
+    }
+    
+    def _format_item(self, item: ReviewItem) -> str:
+        """One queue line for a review item"""
+        priority_icon = self.PRIORITY_ICONS.get(item.priority, "🟢")
+        
+        desc = item.description
+        max_desc_len = self.width - 20  # Account for icons and agent ID
+        if len(desc) > max_desc_len:
+            desc = desc[:max_desc_len-1] + "…"
+            
+        return f"{priority_icon} {item.agent_id}: {desc}"
+        
     def get_content_lines(self) -> List[str]:
         """Generate review queue content"""
         if not self.review_items:
             return ["No review items"]
-            
-        lines = []
-        for item in self.review_items:
-            # Priority icon
-            priority_icon = {
-                "critical": "🚨",
-                "high": "🟡", 
-                "medium": "🟢"
-            }.get(item.priority, "🟢")
-            
-            # Format line
-            desc = item.description
-            max_desc_len = self.width - 20  # Account for icons and agent ID
-            if len(desc) > max_desc_len:
-                desc = desc[:max_desc_len-1] + "…"
-                
-            line = f"{priority_icon} {item.agent_id}: {desc}"
-            lines.append(line)
-            
-        return lines
+        return list(map(self._format_item, self.review_items))
+        
+    def get_visible_lines(self, start: int, count: int) -> Tuple[List[str], int]:
+        """Format only the review items in view"""
+        if not self.review_items:
+            return super().get_visible_lines(start, count)
+        return list(map(self._format_item, self.review_items[start:start + count])), len(self.review_items)
         
     def handle_key(self, key: int) -> Optional[str]:
         """Handle keyboard input for review queue"""
@@ -442,22 +541,76 @@ class DetailsComponent(UIComponent):
         super().__init__(PaneType.DETAILS, config)
         self.content_lines: List[str] = []
         
-    def set_content(self, lines: List[str]):
-        """Set detail content lines"""
-        self.content_lines = lines
+        # Content rendered once off-screen, copied to the screen per redraw
+        self._pad = None
+        self._pad_size: Tuple[int, int] = (0, 0)
+        
+    def set_content(self, content: Union[List[str], str]):
+        """Set detail content from lines or a pre-joined newline buffer"""
+        self.content_lines = content.split("\n") if isinstance(content, str) else content
         self.scroll_offset = 0
+        self._pad = None
         
     def get_content_lines(self) -> List[str]:
         """Get detail content"""
         return self.content_lines if self.content_lines else ["No details available"]
+        
+    def _render_pad(self, lines: List[str], height: int, width: int):
+        """Render all content lines into a pad sized for any scroll offset"""
+        pad_height = max(len(lines), height) + 1  # Spare row: never write the last cell
+        pad = curses.newpad(pad_height, width)
+        
+        for i, line in enumerate(lines):
+            try:
+                pad.addstr(i, 0, _fit_cells(line, width))
+            except curses.error:
+                pass
+                
+        self._pad = pad
+        self._pad_size = (height, width)
+        
+    def _draw_content(self, stdscr, y: int, x: int, height: int, width: int, terminal_info):
+        """Draw content with one pad-to-screen copy instead of an addstr per line"""
+        lines = self.get_content_lines()
+        self.content_height = len(lines)
+        # A pane grown by a resize must not copy from past the pad's last row
+        self.scroll_offset = min(self.scroll_offset, max(0, len(lines) - height))
+        
+        try:
+            if self._pad is None or self._pad_size != (height, width):
+                self._render_pad(lines, height, width)
+            self._pad.overwrite(stdscr, self.scroll_offset, 0, y, x, y + height - 1, x + width - 1)
+            self.invalidate_rows()
+        except curses.error:
+            # No pad support (e.g. headless/mock screens): draw line by line
+            self._pad = None
+            super()._draw_content(stdscr, y, x, height, width, terminal_info)
+            return
+            
+        # Highlight selected line
+        visible_row = self.selected_index - self.scroll_offset
+        if self.is_focused and 0 <= visible_row < height and self.selected_index < len(lines):
+            try:
+                stdscr.chgat(y + visible_row, x, width, curses.A_REVERSE)
+            except curses.error:
+                pass
 
 class LayoutManager:
     """Manages terminal layout and component positioning"""
     
+    # Tab order, as a successor map so cycling is one lookup
+    PANE_ORDER = (PaneType.AGENTS, PaneType.TASKS, PaneType.REVIEW, PaneType.DETAILS)
+    NEXT_PANE = dict(zip(PANE_ORDER, PANE_ORDER[1:] + PANE_ORDER[:1]))
+    
     def __init__(self):
         self.components: Dict[PaneType, UIComponent] = {}
         self.current_layout: Optional[Layout] = None
         self.focused_pane: PaneType = PaneType.AGENTS
+        self._layout_cache: Dict[Tuple[int, int], Layout] = {}  # Layouts by (width, height)
+        
+        # What the header/footer last showed; partial redraws skip them when unchanged
+        self._header_key: Optional[Tuple] = None
+        self._footer_key: Optional[Tuple] = None
         
     def add_component(self, component: UIComponent):
         """Add a component to the layout"""
@@ -495,7 +648,11 @@ class LayoutManager:
         
     def update_layout(self, terminal_width: int, terminal_height: int):
         """Update component layout for new terminal size"""
-        self.current_layout = self.calculate_layout(terminal_width, terminal_height)
+        # Layout is pure integer math on the size, so reuse it across resizes
+        size = (terminal_width, terminal_height)
+        if size not in self._layout_cache:
+            self._layout_cache[size] = self.calculate_layout(terminal_width, terminal_height)
+        self.current_layout = self._layout_cache[size]
         
         # Update component dimensions
         for pane_type, component in self.components.items():
@@ -516,14 +673,7 @@ class LayoutManager:
             
     def cycle_focus(self):
         """Cycle focus to next pane"""
-        pane_order = [PaneType.AGENTS, PaneType.TASKS, PaneType.REVIEW, PaneType.DETAILS]
-        
-        try:
-            current_index = pane_order.index(self.focused_pane)
-            next_index = (current_index + 1) % len(pane_order)
-            self.set_focus(pane_order[next_index])
-        except ValueError:
-            self.set_focus(PaneType.AGENTS)
+        self.set_focus(self.NEXT_PANE.get(self.focused_pane, PaneType.AGENTS))
             
     def handle_key(self, key: int) -> Optional[str]:
         """Handle keyboard input for focused component"""
@@ -532,17 +682,39 @@ class LayoutManager:
             return focused_component.handle_key(key)
         return None
         
-    def draw_all(self, stdscr, terminal_info):
-        """Draw all components"""
-        # Clear screen
-        stdscr.clear()
-        
+    def draw_all(self, stdscr, terminal_info, dirty: Optional[Set[PaneType]] = None):
+        """
+        Draw all components
+        
+        Args:
+            dirty: Panes that need repainting. None forces a full redraw
+                (clear + every pane); an empty set leaves the panes untouched.
+        """
+        full_redraw = dirty is None
+        
+        if full_redraw:
+            # Blank the virtual screen only; doupdate() then sends just the
+            # cells that differ. Wiping the terminal itself (clear()) is left
+            # to the engine, which does it when the screen may hold garbage
+            stdscr.erase()
+            for component in self.components.values():
+                component.invalidate_rows()
+            self._header_key = None
+            self._footer_key = None
+        elif not dirty:
+            return
+            
         # Draw header
         self._draw_header(stdscr, terminal_info)
         
-        # Draw all components
-        for component in self.components.values():
-            component.draw(stdscr, terminal_info)
+        # Draw damaged components only
+        footer_y = terminal_info.height - 3
+        for pane_type, component in self.components.items():
+            if full_redraw or pane_type in dirty:
+                component.draw(stdscr, terminal_info)
+                if component.y + component.height > footer_y:
+                    # Squeezed layouts can spill over the footer
+                    self._footer_key = None
             
         # Draw footer
         self._draw_footer(stdscr, terminal_info)
@@ -550,18 +722,24 @@ class LayoutManager:
     def _draw_header(self, stdscr, terminal_info):
         """Draw header with title and status"""
         title = "🤖 Agent Manager - Human-in-Loop Control Interface"
+        agent_component = self.components.get(PaneType.AGENTS)
+        review_component = self.components.get(PaneType.REVIEW)
+        
+        active_agents = len(agent_component.agents) if agent_component else 0
+        review_items = len(review_component.review_items) if review_component else 0
+        
+        header_key = (active_agents, review_items, self.focused_pane, terminal_info.width)
+        if header_key == self._header_key:
+            return
+        self._header_key = header_key
+        
         try:
             stdscr.addstr(0, 0, title[:terminal_info.width-1], curses.A_BOLD)
             
             # Status line with summary
-            agent_component = self.components.get(PaneType.AGENTS)
-            review_component = self.components.get(PaneType.REVIEW)
-            
-            active_agents = len(agent_component.agents) if agent_component else 0
-            review_items = len(review_component.review_items) if review_component else 0
-            
+            # Padded so a partial redraw overwrites the previous frame's text
             status_line = f"Agents: {active_agents} | Review Items: {review_items} | Focus: {self.focused_pane.value}"
-            stdscr.addstr(1, 0, status_line[:terminal_info.width-1])
+            stdscr.addstr(1, 0, status_line.ljust(terminal_info.width-1)[:terminal_info.width-1])
             
             # Separator
             stdscr.addstr(2, 0, "─" * terminal_info.width)
@@ -571,6 +749,11 @@ class LayoutManager:
             
     def _draw_footer(self, stdscr, terminal_info):
         """Draw footer with controls"""
+        footer_key = (self.focused_pane, terminal_info.width, terminal_info.height)
+        if footer_key == self._footer_key:
+            return
+        self._footer_key = footer_key
+        
         try:
             footer_y = terminal_info.height - 3
             
@@ -581,7 +764,7 @@ class LayoutManager:
             
             # Current focus hint
             focus_hint = f"Focus: {self.focused_pane.value} | [h]elp for more commands"
-            stdscr.addstr(footer_y + 2, 0, focus_hint[:terminal_info.width-1], curses.A_DIM)
+            stdscr.addstr(footer_y + 2, 0, focus_hint.ljust(terminal_info.width-1)[:terminal_info.width-1], curses.A_DIM)
             
         except curses.error:
             pass
@@ -622,7 +805,6 @@ if __name__ == "__main__":
     
     # Create mock data
     from data.file_parser import AgentInfo, ReviewItem
-    from datetime import datetime
     
     mock_agents = [
         AgentInfo("agent-1", "active", "high", "Working on API endpoints", datetime.now()),